@@ -8,48 +8,68 @@ all the complexities of string escaping and error handling.
 
 import logging
 import subprocess  # nosec B404 - Required for running AppleScript commands
-import tempfile
+import threading
+import time
 from datetime import datetime
 
+import things
+
+from .database import things_db
 from .date_converter import update_applescript_with_due_date
 
 logger = logging.getLogger(__name__)
 
+# A successful readiness check is trusted for this long before Things is probed again
+THINGS_READY_TTL = 30.0
+_things_ready_until = 0.0
+# How long to keep re-probing a Things that is running but not answering yet (e.g. still launching)
+THINGS_READY_WAIT = 2.0
+# Only one thread probes at a time; threads that waited for that probe reuse its result
+_readiness_lock = threading.Lock()
+_readiness_probes = 0
+_last_readiness = False
+
+# Checks that Things is running (without launching it or asking System Events)
+# and that it answers an Apple event, in a single osascript run
+_READINESS_SCRIPT = """
+if application "Things3" is running then
+    tell application "Things3" to get name
+    return "ready"
+end if
+return "not running"
+"""
 
-def run_applescript(script: str, timeout: int = 8) -> str:
-    """Run an AppleScript command and return its output."""
-    logger.debug(f"Running AppleScript:\n{script}")
-
-    try:
-        # Handle special characters by writing to a temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".applescript", delete=False) as f:
-            f.write(script)
-            script_path = f.name
-
-        logger.info(f"Running script from file: {script_path}")
 
-        # Run the AppleScript from the file
-        process = subprocess.Popen(["osascript", script_path], stdout=subprocess.PIPE, stderr=subprocess.PIPE)  # nosec B607 B603
-        stdout, stderr = process.communicate(timeout=timeout)
+def run_applescript(script: str, timeout: int = 8, args: tuple[str, ...] = ()) -> str:
+    """Run an AppleScript command and return its output.
 
-        # Clean up the temporary file
-        import os
+    ``args`` are passed to the script's ``on run argv`` handler, so values can be
+    supplied without being spliced into the script source.
+    """
+    logger.debug(f"Running AppleScript{f' with args {args!r}' if args else ''}:\n{script}")
 
-        os.unlink(script_path)
+    try:
+        # Feed the script over stdin; special characters pass through untouched
+        # and no temporary file has to be written and removed per call. The
+        # codec is pinned so output is decoded once, without a locale lookup.
+        process = subprocess.Popen(["osascript", "-", *args], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding="utf-8", errors="replace")  # nosec B607 B603
+        stdout, stderr = process.communicate(input=script, timeout=timeout)
 
         # Log the results
         logger.debug(f"AppleScript return code: {process.returncode}")
-        logger.debug(f"AppleScript stdout: {stdout.decode('utf-8') if stdout else 'None'}")
-        logger.debug(f"AppleScript stderr: {stderr.decode('utf-8') if stderr else 'None'}")
+        logger.debug(f"AppleScript stdout: {stdout or 'None'}")
+        logger.debug(f"AppleScript stderr: {stderr or 'None'}")
 
         # Check for errors
+        # osascript reports compile and runtime failures as "NNN:NNN: ... error: ..." on
+        # stderr; prefix them so callers can't mistake the message for a returned ID
         if process.returncode != 0:
-            error_msg = stderr.decode("utf-8") if stderr else "Unknown error"
+            error_msg = stderr.strip() or "Unknown error"
             logger.error(f"AppleScript error: {error_msg}")
-            return error_msg
+            return f"Error: {error_msg}"
 
         # Return the output
-        output = stdout.decode("utf-8").strip()
+        output = stdout.strip()
         logger.debug(f"AppleScript output (raw): {output!r}")
 
         # Convert boolean responses to consistent string format
@@ -66,34 +86,73 @@ def run_applescript(script: str, timeout: int = 8) -> str:
     except subprocess.TimeoutExpired:
         logger.error(f"AppleScript timed out after {timeout} seconds")
         process.kill()
+        # Things may have hung or quit, so don't keep trusting the last readiness check
+        invalidate_things_ready()
         return "Error: AppleScript timed out"
     except Exception as e:
         logger.error(f"Error running AppleScript: {e!s}")
         return f"Error: {e!s}"
 
 
+def invalidate_things_ready() -> None:
+    """Forget the cached readiness check so the next write probes Things again."""
+    global _things_ready_until
+    _things_ready_until = 0.0
+
+
 def ensure_things_ready() -> bool:
     """Ensure Things app is ready for AppleScript operations.
 
+    A positive result is cached for THINGS_READY_TTL seconds so consecutive
+    writes don't each pay for an extra osascript launch; failures are never
+    cached. Concurrent callers share a single probe rather than each
+    launching their own.
+
     Returns:
     -------
         bool: True if Things is ready, False otherwise
     """
-    try:
-        # First check if Things is running
-        check_script = 'tell application "System Events" to (name of processes) contains "Things3"'
-        result = run_applescript(check_script, timeout=5)
+    global _things_ready_until, _readiness_probes, _last_readiness
+
+    if time.monotonic() < _things_ready_until:
+        return True
+
+    probes_seen = _readiness_probes
+    with _readiness_lock:
+        if _readiness_probes != probes_seen:
+            # Another thread finished a probe while we were waiting for the lock
+            return _last_readiness
 
-        if not result or result.lower() != "true":
+        _things_ready_until = 0.0
+        _last_readiness = _probe_things_ready()
+        _readiness_probes += 1
+        if _last_readiness:
+            _things_ready_until = time.monotonic() + THINGS_READY_TTL
+        return _last_readiness
+
+
+def _probe_things_ready() -> bool:
+    """Ask Things whether it is running and responsive.
+
+    If Things is running but doesn't answer yet, it is re-probed with
+    exponential backoff for up to THINGS_READY_WAIT seconds.
+    """
+    try:
+        give_up_at = time.monotonic() + THINGS_READY_WAIT
+        delay = 0.1
+        while True:
+            result = run_applescript(_READINESS_SCRIPT, timeout=5)
+            if result in ("ready", "not running") or time.monotonic() + delay > give_up_at:
+                break
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+        if result == "not running":
             logger.warning("Things app is not running")
             return False
 
-        # Then check if Things is responsive
-        ping_script = 'tell application "Things3" to return name'
-        result = run_applescript(ping_script, timeout=5)
-
-        if not result:
-            logger.warning("Things app is not responsive")
+        if result != "ready":
+            logger.warning(f"Things app is not responsive: {result}")
             return False
 
         logger.debug("Things app is ready for operations")
@@ -150,6 +209,99 @@ def escape_applescript_string(text: str) -> str:
         return f'"{text}"'
 
 
+def _tag_names_string(tags: list[str]) -> str:
+    """Build the AppleScript value for a ``tag names`` property.
+
+    Things takes tags as one comma-separated string. Blank entries are dropped
+    and surrounding whitespace is stripped from each name.
+
+    Args:
+    ----
+        tags: Tag names to apply
+
+    Returns:
+    -------
+        The escaped, comma-separated tag string ready for AppleScript
+    """
+    return escape_applescript_string(", ".join(tag for tag in (t.strip() for t in tags) if tag))
+
+
+def _todo_creation_lines(  # noqa: PLR0913
+    title: str,
+    notes: str | None = None,
+    when: str | None = None,
+    deadline: str | None = None,
+    tags: list[str] | None = None,
+    list_id: str | None = None,
+    list_title: str | None = None,
+) -> list[str]:
+    """Build the AppleScript lines that create a todo as ``newTodo`` inside a Things tell block."""
+    script_parts: list[str] = []
+
+    # Create the todo with basic properties first
+    properties = [f"name:{escape_applescript_string(title)}"]
+    if notes:
+        properties.append(f"notes:{escape_applescript_string(notes)}")
+
+    # Create in Inbox first (simplest approach)
+    script_parts.append(f'set newTodo to make new to do with properties {{{", ".join(properties)}}} at beginning of list "Inbox"')
+
+    # Handle scheduling using the standardized helper
+    _handle_when_scheduling(script_parts, when, "newTodo")
+
+    # Add tags if provided
+    if tags and len(tags) > 0:
+        script_parts.append(f"set tag names of newTodo to {_tag_names_string(tags)}")
+
+    # Handle deadline using the date converter
+    if deadline:
+        update_applescript_with_due_date(script_parts, deadline, "newTodo")
+
+    # Handle project/area assignment by title
+    if list_title:
+        escaped_list = escape_applescript_string(list_title)
+        script_parts.extend(
+            [
+                f"set list_name to {escaped_list}",
+                "try",
+                "  -- Try to find as project first",
+                "  set target_project to first project whose name is list_name",
+                "  set project of newTodo to target_project",
+                "on error",
+                "  try",
+                "    -- Try to find as area",
+                "    set target_area to first area whose name is list_name",
+                "    set area of newTodo to target_area",
+                "  on error",
+                "    -- Neither project nor area found, will create todo without assignment",
+                "  end try",
+                "end try",
+            ]
+        )
+
+    # Handle project/area assignment by ID
+    if list_id:
+        script_parts.extend(
+            [
+                "try",
+                "  -- Try to find as project by ID",
+                f'  set target_project to project id "{list_id}"',
+                "  set project of newTodo to target_project",
+                "on error",
+                "  try",
+                "    -- Try to find as area by ID",
+                f'    set target_area to area id "{list_id}"',
+                "    set area of newTodo to target_area",
+                "  on error",
+                "    -- Neither project nor area found with ID, will create todo without assignment",
+                "  end try",
+                "end try",
+            ]
+        )
+
+    return script_parts
+
+
 def add_todo(  # noqa: PLR0913
     title: str,
     notes: str | None = None,
@@ -189,86 +341,34 @@ def add_todo(  # noqa: PLR0913
 
     # Build the AppleScript command
     script_parts = ['tell application "Things3"', "try"]
-
-    # Create the todo with basic properties first
-    properties = [f"name:{escape_applescript_string(title)}"]
-    if notes:
-        properties.append(f"notes:{escape_applescript_string(notes)}")
-
-    # Create in Inbox first (simplest approach)
-    script_parts.append(f'set newTodo to make new to do with properties {{{", ".join(properties)}}} at beginning of list "Inbox"')
-
-    # Handle scheduling using the standardized helper
-    _handle_when_scheduling(script_parts, when, "newTodo")
-
-    # Add tags if provided
-    if tags and len(tags) > 0:
-        # Tags should be set as a comma-separated string according to Things documentation
-        tag_string = ", ".join(tags)
-        escaped_tag_string = escape_applescript_string(tag_string)
-        script_parts.append(f"set tag names of newTodo to {escaped_tag_string}")
-
-    # Handle deadline using the date converter
-    if deadline:
-        update_applescript_with_due_date(script_parts, deadline, "newTodo")
-
-    # Handle project/area assignment by title
-    if list_title:
-        escaped_list = escape_applescript_string(list_title)
-        script_parts.append(f"set list_name to {escaped_list}")
-        script_parts.append("try")
-        script_parts.append("  -- Try to find as project first")
-        script_parts.append("  set target_project to first project whose name is list_name")
-        script_parts.append("  set project of newTodo to target_project")
-        script_parts.append("on error")
-        script_parts.append("  try")
-        script_parts.append("    -- Try to find as area")
-        script_parts.append("    set target_area to first area whose name is list_name")
-        script_parts.append("    set area of newTodo to target_area")
-        script_parts.append("  on error")
-        script_parts.append("    -- Neither project nor area found, will create todo without assignment")
-        script_parts.append("  end try")
-        script_parts.append("end try")
-
-    # Handle project/area assignment by ID
-    if list_id:
-        script_parts.append("try")
-        script_parts.append("  -- Try to find as project by ID")
-        script_parts.append(f'  set target_project to first project whose id is "{list_id}"')
-        script_parts.append("  set project of newTodo to target_project")
-        script_parts.append("on error")
-        script_parts.append("  try")
-        script_parts.append("    -- Try to find as area by ID")
-        script_parts.append(f'    set target_area to first area whose id is "{list_id}"')
-        script_parts.append("    set area of newTodo to target_area")
-        script_parts.append("  on error")
-        script_parts.append("    -- Neither project nor area found with ID, will create todo without assignment")
-        script_parts.append("  end try")
-        script_parts.append("end try")
+    script_parts.extend(_todo_creation_lines(title, notes, when, deadline, tags, list_id, list_title))
 
     # Get the ID of the created todo
-    script_parts.append("return id of newTodo")
-    script_parts.append("on error errMsg")
-    script_parts.append('  log "Error creating todo: " & errMsg')
-    script_parts.append("  return false")
-    script_parts.append("end try")
-    script_parts.append("end tell")
+    script_parts.extend(
+        [
+            "return id of newTodo",
+            "on error errMsg",
+            '  log "Error creating todo: " & errMsg',
+            "  return false",
+            "end try",
+            "end tell",
+        ]
+    )
 
     # Execute the script
     script = "\n".join(script_parts)
     logger.debug(f"Executing simplified AppleScript: {script}")
 
     result = run_applescript(script, timeout=8)
-    if result and result != "false" and "script error" not in result and not result.startswith("/var/folders/") and not result.startswith("Error:"):
+    if result and result != "false" and not result.startswith("Error:"):
         # Look up the todo to get location information
         try:
-            import things
-            todo = things.get(result)
+            todo = things.get(result, database=things_db())
             if todo:
                 if todo.get("project"):
-                    location = f"Project: {things.get(todo['project'])['title']}"
+                    location = f"Project: {things.get(todo['project'], database=things_db())['title']}"
                 elif todo.get("area"):
-                    location = f"Area: {things.get(todo['area'])['title']}"
+                    location = f"Area: {things.get(todo['area'], database=things_db())['title']}"
                 else:
                     location = f"List: {todo.get('start', 'Unknown')}"
                 logger.info(f"Successfully created todo via AppleScript with ID: {result} in {location}")
@@ -282,6 +382,77 @@ def add_todo(  # noqa: PLR0913
         return False
 
 
+def add_todos(todos: list[dict]) -> list[str | bool]:
+    """Add several todos to Things with a single AppleScript run.
+
+    Each todo is created in its own try block, so one bad entry doesn't stop
+    the rest of the batch.
+
+    Args:
+    ----
+        todos: Todo specs, each with a "title" and optionally "notes", "when",
+            "deadline", "tags", "list_id" and "list_title" as accepted by add_todo
+
+    Returns:
+    -------
+        For each input todo, in order, the ID of the created todo or False
+    """
+    if not todos:
+        return []
+
+    if not all(todo.get("title") and todo["title"].strip() for todo in todos):
+        logger.error("Title cannot be empty")
+        return [False] * len(todos)
+
+    if not ensure_things_ready():
+        logger.error("Things app is not ready for operations")
+        return [False] * len(todos)
+
+    script_parts = ['tell application "Things3"', "set createdIds to {}"]
+    for todo in todos:
+        script_parts.append("try")
+        script_parts.extend(
+            _todo_creation_lines(
+                todo["title"],
+                todo.get("notes"),
+                todo.get("when"),
+                todo.get("deadline"),
+                todo.get("tags"),
+                todo.get("list_id"),
+                todo.get("list_title"),
+            )
+        )
+        script_parts.extend(
+            [
+                "set end of createdIds to (id of newTodo)",
+                "on error errMsg",
+                '  log "Error creating todo: " & errMsg',
+                '  set end of createdIds to ""',
+                "end try",
+            ]
+        )
+    # Things IDs never contain commas, so a comma-joined list keeps failed slots as empty fields
+    script_parts.extend(
+        [
+            'set AppleScript\'s text item delimiters to ","',
+            "return createdIds as text",
+            "end tell",
+        ]
+    )
+
+    script = "\n".join(script_parts)
+    logger.debug(f"Executing batch AppleScript for {len(todos)} todos: {script}")
+
+    result = run_applescript(script, timeout=8 + 2 * len(todos))
+    ids = result.split(",") if result and not result.startswith("Error:") else []
+    if len(ids) != len(todos):
+        logger.error(f"Failed to create todos: {result}")
+        return [False] * len(todos)
+
+    logger.info(f"Created {sum(1 for todo_id in ids if todo_id)}/{len(todos)} todos via AppleScript")
+    return [todo_id or False for todo_id in ids]
+
+
 def is_valid_date_format(date_string: str) -> bool:
     """Check if a string matches YYYY-MM-DD date format."""
     try:
@@ -437,49 +608,54 @@ def update_todo(
         if isinstance(tags, str):
             tags = [tags]
         if tags:
-            # Set all tags at once using comma-separated string
-            tag_string = ", ".join(tags)
-            escaped_tag_string = escape_applescript_string(tag_string)
-            script_parts.append(f"    set tag names of theTodo to {escaped_tag_string}")
+            script_parts.append(f"    set tag names of theTodo to {_tag_names_string(tags)}")
 
     # Handle list assignment (built-in lists, projects, or areas)
     if list_name:
         escaped_list = escape_applescript_string(list_name)
-        script_parts.append("    try")
-        # First try to find as built-in list
-        script_parts.append(f"        set targetList to list {escaped_list}")
-        script_parts.append("        move theTodo to targetList")
-        script_parts.append("    on error")
-        script_parts.append("        try")
-        # Then try to find as project
-        script_parts.append(f"            set targetProject to first project whose name is {escaped_list}")
-        script_parts.append("            set project of theTodo to targetProject")
-        script_parts.append("        on error")
-        script_parts.append("            try")
-        # Finally try to find as area
-        script_parts.append(f"                set targetArea to first area whose name is {escaped_list}")
-        script_parts.append("                set area of theTodo to targetArea")
-        script_parts.append("            on error")
-        script_parts.append(f'                return "Error: List/Project/Area not found - {list_name}"')
-        script_parts.append("            end try")
-        script_parts.append("        end try")
-        script_parts.append("    end try")
+        script_parts.extend(
+            [
+                "    try",
+                # First try to find as built-in list
+                f"        set targetList to list {escaped_list}",
+                "        move theTodo to targetList",
+                "    on error",
+                "        try",
+                # Then try to find as project
+                f"            set targetProject to first project whose name is {escaped_list}",
+                "            set project of theTodo to targetProject",
+                "        on error",
+                "            try",
+                # Finally try to find as area
+                f"                set targetArea to first area whose name is {escaped_list}",
+                "                set area of theTodo to targetArea",
+                "            on error",
+                f'                return "Error: List/Project/Area not found - {list_name}"',
+                "            end try",
+                "        end try",
+                "    end try",
+            ]
+        )
 
     # Handle list assignment by ID (projects or areas only)
     if list_id:
-        script_parts.append("    try")
-        # Try to find as project by ID
-        script_parts.append(f'        set targetProject to first project whose id is "{list_id}"')
-        script_parts.append("        set project of theTodo to targetProject")
-        script_parts.append("    on error")
-        script_parts.append("        try")
-        # Try to find as area by ID
-        script_parts.append(f'            set targetArea to first area whose id is "{list_id}"')
-        script_parts.append("            set area of theTodo to targetArea")
-        script_parts.append("        on error")
-        script_parts.append(f'            return "Error: Project/Area not found with ID - {list_id}"')
-        script_parts.append("        end try")
-        script_parts.append("    end try")
+        script_parts.extend(
+            [
+                "    try",
+                # Try to find as project by ID
+                f'        set targetProject to project id "{list_id}"',
+                "        set project of theTodo to targetProject",
+                "    on error",
+                "        try",
+                # Try to find as area by ID
+                f'            set targetArea to area id "{list_id}"',
+                "            set area of theTodo to targetArea",
+                "        on error",
+                f'            return "Error: Project/Area not found with ID - {list_id}"',
+                "        end try",
+                "    end try",
+            ]
+        )
 
     # Handle completion status
     if completed is not None:
@@ -496,11 +672,15 @@ def update_todo(
             script_parts.append("    set status of theTodo to open")
 
     # Return true on success
-    script_parts.append("    return true")
-    script_parts.append("on error errMsg")
-    script_parts.append('    return "Error: " & errMsg')
-    script_parts.append("end try")
-    script_parts.append("end tell")
+    script_parts.extend(
+        [
+            "    return true",
+            "on error errMsg",
+            '    return "Error: " & errMsg',
+            "end try",
+            "end tell",
+        ]
+    )
 
     # Execute the script
     script = "\n".join(script_parts)
@@ -556,24 +736,32 @@ def add_project(
     if area_id or area_title:
         if area_id:
             # Try to find area by ID first
-            script_parts.append(f'set area_id to "{area_id}"')
-            script_parts.append("try")
-            script_parts.append("  set target_area to first area whose id is area_id")
-            script_parts.append("  set area_ref to target_area")
-            script_parts.append("on error")
-            script_parts.append("  -- Area not found by ID, will create project without area")
-            script_parts.append("  set area_ref to missing value")
-            script_parts.append("end try")
+            script_parts.extend(
+                [
+                    f'set area_id to "{area_id}"',
+                    "try",
+                    "  set target_area to area id area_id",
+                    "  set area_ref to target_area",
+                    "on error",
+                    "  -- Area not found by ID, will create project without area",
+                    "  set area_ref to missing value",
+                    "end try",
+                ]
+            )
         else:
             # Find area by title
-            script_parts.append(f"set area_name to {escape_applescript_string(area_title)}")
-            script_parts.append("try")
-            script_parts.append("  set target_area to first area whose name is area_name")
-            script_parts.append("  set area_ref to target_area")
-            script_parts.append("on error")
-            script_parts.append("  -- Area not found, will create project without area")
-            script_parts.append("  set area_ref to missing value")
-            script_parts.append("end try")
+            script_parts.extend(
+                [
+                    f"set area_name to {escape_applescript_string(area_title)}",
+                    "try",
+                    "  set target_area to first area whose name is area_name",
+                    "  set area_ref to target_area",
+                    "on error",
+                    "  -- Area not found, will create project without area",
+                    "  set area_ref to missing value",
+                    "end try",
+                ]
+            )
 
     # Build properties for the project
     properties = [f"name:{escape_applescript_string(title)}"]
@@ -582,12 +770,16 @@ def add_project(
 
     # Add area to properties if found
     if area_id or area_title:
-        script_parts.append("if area_ref is not missing value then")
-        script_parts.append("  set area_property to {area:area_ref}")
-        script_parts.append("else")
-        script_parts.append("  set area_property to {}")
-        script_parts.append("end if")
-        script_parts.append(f"set newProject to make new project with properties {{{', '.join(properties)}}} & area_property")
+        script_parts.extend(
+            [
+                "if area_ref is not missing value then",
+                "  set area_property to {area:area_ref}",
+                "else",
+                "  set area_property to {}",
+                "end if",
+                f"set newProject to make new project with properties {{{', '.join(properties)}}} & area_property",
+            ]
+        )
     else:
         # Create the project without area
         script_parts.append(f"set newProject to make new project with properties {{{', '.join(properties)}}}")
@@ -597,10 +789,7 @@ def add_project(
 
     # Add tags if provided
     if tags and len(tags) > 0:
-        # Tags should be set as a comma-separated string according to Things documentation
-        tag_string = ", ".join(tags)
-        escaped_tag_string = escape_applescript_string(tag_string)
-        script_parts.append(f"set tag names of newProject to {escaped_tag_string}")
+        script_parts.append(f"set tag names of newProject to {_tag_names_string(tags)}")
 
     # Handle deadline
     if deadline:
@@ -623,14 +812,13 @@ def add_project(
     logger.debug(f"Executing AppleScript: {script}")
 
     result = run_applescript(script, timeout=8)
-    if result and result != "false" and "script error" not in result and not result.startswith("/var/folders/") and not result.startswith("Error:"):
+    if result and result != "false" and not result.startswith("Error:"):
         # Look up the project to get location information for logging
         try:
-            import things
-            project = things.get(result)
+            project = things.get(result, database=things_db())
             if project:
                 if project.get("area"):
-                    location = f"Area: {things.get(project['area'])['title']}"
+                    location = f"Area: {things.get(project['area'], database=things_db())['title']}"
                 else:
                     location = "List: Inbox"
                 logger.info(f"Successfully created project via AppleScript with ID: {result} in {location}")
@@ -733,20 +921,28 @@ def update_project(
     # Handle area changes
     if area_id:
         # Use area_id if provided (takes precedence over area_title)
-        script_parts.append("    try")
-        script_parts.append(f'        set targetArea to first area whose id is "{area_id}"')
-        script_parts.append("        set area of theProject to targetArea")
-        script_parts.append("    on error")
-        script_parts.append(f'        return "Error: Area not found with ID - {area_id}"')
-        script_parts.append("    end try")
+        script_parts.extend(
+            [
+                "    try",
+                f'        set targetArea to area id "{area_id}"',
+                "        set area of theProject to targetArea",
+                "    on error",
+                f'        return "Error: Area not found with ID - {area_id}"',
+                "    end try",
+            ]
+        )
     elif area_title:
         escaped_area = escape_applescript_string(area_title)
-        script_parts.append("    try")
-        script_parts.append(f"        set targetArea to first area whose name is {escaped_area}")
-        script_parts.append("        set area of theProject to targetArea")
-        script_parts.append("    on error")
-        script_parts.append(f'        return "Error: Area not found - {area_title}"')
-        script_parts.append("    end try")
+        script_parts.extend(
+            [
+                "    try",
+                f"        set targetArea to first area whose name is {escaped_area}",
+                "        set area of theProject to targetArea",
+                "    on error",
+                f'        return "Error: Area not found - {area_title}"',
+                "    end try",
+            ]
+        )
 
     # Handle other property updates
     if title:
@@ -755,9 +951,7 @@ def update_project(
         script_parts.append(f"    set notes of theProject to {escape_applescript_string(notes)}")
     if tags is not None:
         if tags:
-            tag_string = ", ".join(tags)
-            escaped_tag_string = escape_applescript_string(tag_string)
-            script_parts.append(f"    set tag names of theProject to {escaped_tag_string}")
+            script_parts.append(f"    set tag names of theProject to {_tag_names_string(tags)}")
         else:
             script_parts.append('    set tag names of theProject to ""')
     if deadline:
@@ -767,11 +961,15 @@ def update_project(
     if canceled is not None:
         script_parts.append("    set status of theProject to canceled")
 
-    script_parts.append("    return true")
-    script_parts.append("on error errMsg")
-    script_parts.append('    return "Error: " & errMsg')
-    script_parts.append("end try")
-    script_parts.append("end tell")
+    script_parts.extend(
+        [
+            "    return true",
+            "on error errMsg",
+            '    return "Error: " & errMsg',
+            "end try",
+            "end tell",
+        ]
+    )
 
     # Execute the script
     script = "\n".join(script_parts)
@@ -0,0 +1,53 @@
+"""Reusable things.py database handles.
+
+Every things.py call made without a ``database`` argument opens a new SQLite
+connection and re-checks the database version. A single tool call can make
+dozens of those calls (formatters look up each todo's project and area), so
+each thread keeps one read-only handle and passes it to things.py instead.
+
+Handles live as long as their thread and are not closed on exit; tools run on
+asyncio's reused worker threads, so only a few are ever open. Things replaces
+the database file when it syncs or migrates, and an open connection would keep
+reading the old file, so a handle is re-opened once its file has been replaced,
+and reset_things_db() drops it after a sqlite3.DatabaseError.
+"""
+
+import os
+import threading
+
+from things.database import Database
+
+# sqlite3 connections can't be shared between threads, and tools run on worker threads
+_local = threading.local()
+
+
+def _file_id(path: str) -> tuple[int, int] | None:
+    """Return the (device, inode) pair identifying the file at path, or None if it can't be read."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+def things_db() -> Database:
+    """Return this thread's things.py database handle, opening it on first use or after the file was replaced."""
+    database = getattr(_local, "database", None)
+    if database is not None:
+        # A missing file is mid-replacement; keep the old handle until the new one is in place
+        file_id = _file_id(database.filepath)
+        if file_id is None or file_id == _local.file_id:
+            return database
+        reset_things_db()
+
+    database = _local.database = Database()
+    _local.file_id = _file_id(database.filepath)
+    return database
+
+
+def reset_things_db() -> None:
+    """Close this thread's database handle so the next things_db() call opens a new one."""
+    database = getattr(_local, "database", None)
+    if database is not None:
+        _local.database = None
+        database.connection.close()
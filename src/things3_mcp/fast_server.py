@@ -1,8 +1,13 @@
 """Things MCP Server implementation using the FastMCP pattern."""
 
+import asyncio
+import functools
 import json
 import random
+import sqlite3
+import time
 import traceback
+from collections.abc import Callable
 
 import things
 from mcp.server.fastmcp import FastMCP
@@ -10,10 +15,12 @@ from mcp.server.fastmcp import FastMCP
 from .applescript_bridge import (
     add_project,
     add_todo,
+    add_todos,
     ensure_things_ready,
     update_project,
     update_todo,
 )
+from .database import reset_things_db, things_db
 from .formatters import format_area, format_project, format_tag, format_todo
 from .logging_config import (
     get_logger,
@@ -22,11 +29,14 @@ from .logging_config import (
     setup_logging,
 )
 
-# Configure enhanced logging
-setup_logging(console_level="INFO", file_level="DEBUG", structured_logs=True)
 logger = get_logger(__name__)
 
 
+def _format_params(params: dict) -> str:
+    """Render the arguments that were actually passed as one ``name=value, ...`` string for logging."""
+    return ", ".join(f"{name}={value!r}" for name, value in params.items() if value is not None)
+
+
 def preprocess_array_params(**kwargs):
     """Preprocess parameters to handle MCP framework array serialization issues.
 
@@ -55,53 +65,142 @@ def preprocess_array_params(**kwargs):
     return result
 
 
+def retry(
+    max_attempts: int = 3,
+    delay: float = 0.1,
+    backoff: float = 2.0,
+    max_delay: float = 2.0,
+    jitter: float = 0.05,
+    exceptions: tuple[type[BaseException], ...] = (Exception,),
+    on_retry: Callable[[], None] | None = None,
+):
+    """Retry a function with exponential backoff and jitter.
+
+    Only the given exception types are retried; anything else propagates
+    immediately so permanent errors fail fast.
+
+    Args:
+    ----
+        max_attempts: Total number of attempts before giving up
+        delay: Base delay in seconds before the first retry
+        backoff: Multiplier applied to the delay after each attempt
+        max_delay: Upper bound on the delay between attempts, before jitter
+        jitter: Maximum random extra delay in seconds added to each wait
+        exceptions: Exception types that should trigger a retry
+        on_retry: Optional callable run before each retry, e.g. to drop state the failure left stale
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    if attempt == max_attempts - 1:
+                        raise
+                    sleep_for = min(max_delay, delay * (backoff**attempt)) + random.random() * jitter  # noqa: S311  # nosec B311 - jitter, not cryptography
+                    logger.warning(f"{func.__name__} failed (attempt {attempt + 1}/{max_attempts}): {e!s}; retrying in {sleep_for:.2f}s")
+                    if on_retry is not None:
+                        on_retry()
+                    time.sleep(sleep_for)
+
+        return wrapper
+
+    return decorator
+
+
+# Things writes to its SQLite database while we read it, and replaces the file when it
+# syncs or migrates; retry such errors on a freshly opened database handle
+retry_on_db_error = retry(max_attempts=3, exceptions=(sqlite3.DatabaseError,), on_retry=reset_things_db)
+
+
 # Create the FastMCP server
 mcp = FastMCP("Things", instructions="Interact with the Things 3 task management app")
 
+
+def threaded_tool(name: str):
+    """Register a blocking function as an MCP tool that runs on a worker thread.
+
+    Things reads hit SQLite and writes shell out to osascript, so calling them
+    directly from an async handler would stall every other in-flight request.
+    FastMCP gets an async wrapper around asyncio.to_thread; the plain function
+    is returned unchanged for direct callers such as the tests.
+
+    Args:
+    ----
+        name: Tool name exposed over MCP
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def run_in_thread(*args, **kwargs):
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+        mcp.tool(name=name)(run_in_thread)
+        return fn
+
+    return decorator
+
+
+_SEP = "\n\n---\n\n"  # separator between formatted items in tool results
+_PERIOD_UNITS = frozenset("dwmy")  # valid suffixes for periods such as '3d' or '2w'
+
 # LIST VIEWS
 
 
-@mcp.tool(name="get_inbox")
-def get_inbox() -> str:
-    """Get todos from Inbox."""
-    import time
+@retry_on_db_error
+def _list_view(key: str, fetch, empty_message: str) -> str:
+    """Fetch and format one of the built-in Things lists.
 
+    Args:
+    ----
+        key: List name, used to name the logged operation
+        fetch: things.py list function, e.g. things.inbox
+        empty_message: Result to return when the list is empty
+    """
+    operation = f"get-{key}"
     start_time = time.time()
-    log_operation_start("get-inbox")
+    log_operation_start(operation)
 
     try:
-        todos = things.inbox(include_items=True)
+        todos = fetch(include_items=True, database=things_db())
 
         if not todos:
-            log_operation_end("get-inbox", True, time.time() - start_time, count=0)
-            return "No items found in Inbox"
+            log_operation_end(operation, True, time.time() - start_time, count=0)
+            return empty_message
 
-        formatted_todos = [format_todo(todo) for todo in todos]
-        log_operation_end("get-inbox", True, time.time() - start_time, count=len(todos))
-        return "\n\n---\n\n".join(formatted_todos)
+        result = _SEP.join(format_todo(todo) for todo in todos)
+        log_operation_end(operation, True, time.time() - start_time, count=len(todos))
+        return result
     except Exception as e:
-        log_operation_end("get-inbox", False, time.time() - start_time, error=str(e))
+        log_operation_end(operation, False, time.time() - start_time, error=str(e))
         raise
 
 
-@mcp.tool(name="get_today")
+@threaded_tool(name="get_inbox")
+def get_inbox() -> str:
+    """Get todos from Inbox."""
+    return _list_view("inbox", things.inbox, "No items found in Inbox")
+
+
+@threaded_tool(name="get_today")
+@retry_on_db_error
 def get_today() -> str:
     """Get todos due today."""
-    import time
-
     start_time = time.time()
     log_operation_start("get-today")
 
     try:
-        todos = things.today(include_items=True)
+        todos = things.today(include_items=True, database=things_db())
 
         if not todos:
             log_operation_end("get-today", True, time.time() - start_time, count=0)
             return "No items due today"
 
-        formatted_todos = [format_todo(todo) for todo in todos]
+        result = _SEP.join(format_todo(todo) for todo in todos)
         log_operation_end("get-today", True, time.time() - start_time, count=len(todos))
-        return "\n\n---\n\n".join(formatted_todos)
+        return result
     except TypeError as e:
         if "'<' not supported between instances of 'NoneType' and 'str'" in str(e):
             # Handle the known sorting bug in things.today() by using a workaround
@@ -119,13 +218,14 @@ def get_today() -> str:
                     index="todayIndex",
                     status="incomplete",
                     include_items=True,
+                    database=things_db(),
                 )
 
                 # 2. unconfirmed_scheduled_tasks: start_date="past", start="Someday", index="todayIndex"
-                unconfirmed_scheduled_tasks = things.tasks(start_date="past", start="Someday", index="todayIndex", status="incomplete", include_items=True)
+                unconfirmed_scheduled_tasks = things.tasks(start_date="past", start="Someday", index="todayIndex", status="incomplete", include_items=True, database=things_db())
 
                 # 3. unconfirmed_overdue_tasks: start_date=False, deadline="past", deadline_suppressed=False
-                unconfirmed_overdue_tasks = things.tasks(start_date=False, deadline="past", deadline_suppressed=False, status="incomplete", include_items=True)
+                unconfirmed_overdue_tasks = things.tasks(start_date=False, deadline="past", deadline_suppressed=False, status="incomplete", include_items=True, database=things_db())
 
                 # Combine all three categories like the original
                 result = [
@@ -148,11 +248,11 @@ def get_today() -> str:
                     return (today_index, start_date)
 
                 result.sort(key=safe_sort_key)
-                formatted_todos = [format_todo(todo) for todo in result]
                 # Only log success AFTER the fallback actually succeeds
                 if result:
+                    output = _SEP.join(format_todo(todo) for todo in result)
                     log_operation_end("get-today", True, time.time() - start_time, count=len(result))
-                    return "\n\n---\n\n".join(formatted_todos)
+                    return output
                 else:
                     log_operation_end("get-today", True, time.time() - start_time, count=0)
                     return "No items due today"
@@ -168,31 +268,19 @@ def get_today() -> str:
         raise
 
 
-@mcp.tool(name="get_upcoming")
+@threaded_tool(name="get_upcoming")
 def get_upcoming() -> str:
     """Get all upcoming todos (those with a start date in the future)."""
-    todos = things.upcoming(include_items=True)
-
-    if not todos:
-        return "No upcoming items"
-
-    formatted_todos = [format_todo(todo) for todo in todos]
-    return "\n\n---\n\n".join(formatted_todos)
+    return _list_view("upcoming", things.upcoming, "No upcoming items")
 
 
-@mcp.tool(name="get_anytime")
+@threaded_tool(name="get_anytime")
 def get_anytime() -> str:
     """Get all todos from Anytime list. Note that this will return an extensive list of tasks. It is generally recommended to use get_todos with filters or search_todos instead."""
-    todos = things.anytime(include_items=True)
-
-    if not todos:
-        return "No items in Anytime list"
-
-    formatted_todos = [format_todo(todo) for todo in todos]
-    return "\n\n---\n\n".join(formatted_todos)
+    return _list_view("anytime", things.anytime, "No items in Anytime list")
 
 
-@mcp.tool(name="get_random_inbox")
+@threaded_tool(name="get_random_inbox")
 def get_random_inbox(count: int = 5) -> str:
     """Get a random sample of todos from Inbox.
 
@@ -200,13 +288,11 @@ def get_random_inbox(count: int = 5) -> str:
     ----
         count: Number of random items to return. Defaults to 5.
     """
-    import time
-
     start_time = time.time()
     log_operation_start("get-random-inbox")
 
     try:
-        items = things.inbox(include_items=True)
+        items = things.inbox(include_items=True, database=things_db())
 
         if not items:
             log_operation_end("get-random-inbox", True, time.time() - start_time, count=0)
@@ -224,15 +310,15 @@ def get_random_inbox(count: int = 5) -> str:
             log_operation_end("get-random-inbox", True, time.time() - start_time, count=0)
             return "No items found in Inbox"
 
-        formatted = [format_todo(item) for item in sampled]
+        result = _SEP.join(format_todo(item) for item in sampled)
         log_operation_end("get-random-inbox", True, time.time() - start_time, count=len(sampled))
-        return "\n\n---\n\n".join(formatted)
+        return result
     except Exception as e:
         log_operation_end("get-random-inbox", False, time.time() - start_time, error=str(e))
         raise
 
 
-@mcp.tool(name="get_random_anytime")
+@threaded_tool(name="get_random_anytime")
 def get_random_anytime(count: int = 5) -> str:
     """Get a random sample of items from the Anytime list.
 
@@ -243,7 +329,7 @@ def get_random_anytime(count: int = 5) -> str:
     ----
         count: Number of random items to return. Defaults to 5.
     """
-    items = things.anytime(include_items=True)
+    items = things.anytime(include_items=True, database=things_db())
 
     if not items:
         return "No items in Anytime list"
@@ -258,23 +344,17 @@ def get_random_anytime(count: int = 5) -> str:
     if not sampled:
         return "No items in Anytime list"
 
-    formatted = [format_todo(item) for item in sampled]
-    return "\n\n---\n\n".join(formatted)
+    return _SEP.join(format_todo(item) for item in sampled)
 
 
-@mcp.tool(name="get_someday")
+@threaded_tool(name="get_someday")
 def get_someday() -> str:
     """Get todos from Someday list."""
-    todos = things.someday(include_items=True)
-
-    if not todos:
-        return "No items in Someday list"
-
-    formatted_todos = [format_todo(todo) for todo in todos]
-    return "\n\n---\n\n".join(formatted_todos)
+    return _list_view("someday", things.someday, "No items in Someday list")
 
 
-@mcp.tool(name="get_logbook")
+@threaded_tool(name="get_logbook")
+@retry_on_db_error
 def get_logbook(period: str = "7d", limit: int = 50) -> str:
     """Get completed todos from Logbook, defaults to last 7 days.
 
@@ -283,7 +363,6 @@ def get_logbook(period: str = "7d", limit: int = 50) -> str:
         period: Time period to look back (e.g., '3d', '1w', '2m', '1y'). Defaults to '7d'.
         limit: Maximum number of entries to return. Defaults to 50.
     """
-    import time
     from datetime import datetime, timedelta
 
     start_time = time.time()
@@ -291,7 +370,7 @@ def get_logbook(period: str = "7d", limit: int = 50) -> str:
 
     try:
         # Parse period (e.g., "1d", "7d", "2w", "1m", "1y")
-        if not period or period[-1] not in ["d", "w", "m", "y"]:
+        if not period or period[-1] not in _PERIOD_UNITS:
             log_operation_end("get-logbook", False, time.time() - start_time, error=f"Invalid period format: {period}")
             return f"Error: Invalid period format '{period}'. Expected format: '3d', '1w', '2m', '1y'"
 
@@ -311,8 +390,9 @@ def get_logbook(period: str = "7d", limit: int = 50) -> str:
         logger.debug(f"Logbook query: period={period}, start_date>={start_date}")
 
         # Query using stop_date (completion date) instead of last (creation date)
-        # This fixes the bug where items were filtered by creation date instead of completion date
-        todos = things.tasks(status="completed", stop_date=f">={start_date}", include_items=True)
+        # This fixes the bug where items were filtered by creation date instead of completion date.
+        # Checklists are loaded below, only for the entries that survive the limit.
+        todos = things.tasks(status="completed", stop_date=f">={start_date}", database=things_db())
 
         if not todos:
             log_operation_end("get-logbook", True, time.time() - start_time, count=0)
@@ -322,12 +402,14 @@ def get_logbook(period: str = "7d", limit: int = 50) -> str:
         # Use 'or ""' to handle None values safely (prevents TypeError in Python 3)
         todos.sort(key=lambda x: x.get("stop_date") or "", reverse=True)
 
-        if len(todos) > limit:
-            todos = todos[:limit]
+        todos = todos[:limit]
+        for todo in todos:
+            if todo.get("type") == "to-do" and todo.get("checklist"):
+                todo["checklist"] = things.checklist_items(todo["uuid"], database=things_db())
 
-        formatted_todos = [format_todo(todo) for todo in todos]
+        result = _SEP.join(format_todo(todo) for todo in todos)
         log_operation_end("get-logbook", True, time.time() - start_time, count=len(todos))
-        return "\n\n---\n\n".join(formatted_todos)
+        return result
 
     except ValueError as e:
         log_operation_end("get-logbook", False, time.time() - start_time, error=str(e))
@@ -337,19 +419,20 @@ def get_logbook(period: str = "7d", limit: int = 50) -> str:
         raise
 
 
-@mcp.tool(name="get_trash")
+@threaded_tool(name="get_trash")
+@retry_on_db_error
 def get_trash() -> str:
     """Get trashed todos."""
-    todos = things.trash(include_items=True)
+    todos = things.trash(include_items=True, database=things_db())
 
     if not todos:
         return "No items in trash"
 
-    formatted_todos = [format_todo(todo) for todo in todos]
-    return "\n\n---\n\n".join(formatted_todos)
+    return _SEP.join(format_todo(todo) for todo in todos)
 
 
-@mcp.tool(name="get_todos")
+@threaded_tool(name="get_todos")
+@retry_on_db_error
 def get_todos(project_uuid: str | None = None) -> str:
     """Get todos from Things, optionally filtered by project.
 
@@ -358,20 +441,19 @@ def get_todos(project_uuid: str | None = None) -> str:
         project_uuid: Optional UUID of a specific project to get todos from.
     """
     if project_uuid:
-        project = things.get(project_uuid)
+        project = things.get(project_uuid, database=things_db())
         if not project or project.get("type") != "project":
             return f"Error: Invalid project UUID '{project_uuid}'"
 
-    todos = things.todos(project=project_uuid, start=None, include_items=True)
+    todos = things.todos(project=project_uuid, start=None, include_items=True, database=things_db())
 
     if not todos:
         return "No todos found"
 
-    formatted_todos = [format_todo(todo) for todo in todos]
-    return "\n\n---\n\n".join(formatted_todos)
+    return _SEP.join(format_todo(todo) for todo in todos)
 
 
-@mcp.tool(name="get_random_todos")
+@threaded_tool(name="get_random_todos")
 def get_random_todos(project_uuid: str | None = None, count: int = 5) -> str:
     """Get a random sample of todos, optionally filtered by project.
 
@@ -381,11 +463,11 @@ def get_random_todos(project_uuid: str | None = None, count: int = 5) -> str:
         count: Number of todos to return. Defaults to 5.
     """
     if project_uuid:
-        project = things.get(project_uuid)
+        project = things.get(project_uuid, database=things_db())
         if not project or project.get("type") != "project":
             return f"Error: Invalid project UUID '{project_uuid}'"
 
-    items = things.todos(project=project_uuid, start=None, include_items=True)
+    items = things.todos(project=project_uuid, start=None, include_items=True, database=things_db())
 
     if not items:
         return "No todos found"
@@ -400,11 +482,11 @@ def get_random_todos(project_uuid: str | None = None, count: int = 5) -> str:
     if not sampled:
         return "No todos found"
 
-    formatted = [format_todo(todo) for todo in sampled]
-    return "\n\n---\n\n".join(formatted)
+    return _SEP.join(format_todo(todo) for todo in sampled)
 
 
-@mcp.tool(name="get_projects")
+@threaded_tool(name="get_projects")
+@retry_on_db_error
 def get_projects(include_items: bool = False) -> str:
     """Get all projects from Things.
 
@@ -412,16 +494,16 @@ def get_projects(include_items: bool = False) -> str:
     ----
         include_items: Include tasks within projects.
     """
-    projects = things.projects()
+    projects = things.projects(database=things_db())
 
     if not projects:
         return "No projects found"
 
-    formatted_projects = [format_project(project, include_items) for project in projects]
-    return "\n\n---\n\n".join(formatted_projects)
+    return _SEP.join(format_project(project, include_items) for project in projects)
 
 
-@mcp.tool(name="get_areas")
+@threaded_tool(name="get_areas")
+@retry_on_db_error
 def get_areas(include_items: bool = False) -> str:
     """Get all areas from Things. Use these names when assigning a task or project to an area.
 
@@ -429,19 +511,19 @@ def get_areas(include_items: bool = False) -> str:
     ----
         include_items: Include projects and tasks within areas
     """
-    areas = things.areas()
+    areas = things.areas(database=things_db())
 
     if not areas:
         return "No areas found"
 
-    formatted_areas = [format_area(area, include_items) for area in areas]
-    return "\n\n---\n\n".join(formatted_areas)
+    return _SEP.join(format_area(area, include_items) for area in areas)
 
 
 # TAG OPERATIONS
 
 
-@mcp.tool(name="get_tags")
+@threaded_tool(name="get_tags")
+@retry_on_db_error
 def get_tags(include_items: bool = False) -> str:
     """Get all tags.
 
@@ -449,16 +531,16 @@ def get_tags(include_items: bool = False) -> str:
     ----
         include_items: Include items tagged with each tag
     """
-    tags = things.tags()
+    tags = things.tags(database=things_db())
 
     if not tags:
         return "No tags found"
 
-    formatted_tags = [format_tag(tag, include_items) for tag in tags]
-    return "\n\n---\n\n".join(formatted_tags)
+    return _SEP.join(format_tag(tag, include_items) for tag in tags)
 
 
-@mcp.tool(name="get_tagged_items")
+@threaded_tool(name="get_tagged_items")
+@retry_on_db_error
 def get_tagged_items(tag: str) -> str:
     """Get items with a specific tag.
 
@@ -466,19 +548,19 @@ def get_tagged_items(tag: str) -> str:
     ----
         tag: Tag title to filter by
     """
-    todos = things.todos(tag=tag, include_items=True)
+    todos = things.todos(tag=tag, include_items=True, database=things_db())
 
     if not todos:
         return f"No items found with tag '{tag}'"
 
-    formatted_todos = [format_todo(todo) for todo in todos]
-    return "\n\n---\n\n".join(formatted_todos)
+    return _SEP.join(format_todo(todo) for todo in todos)
 
 
 # SEARCH OPERATIONS
 
 
-@mcp.tool(name="search_todos")
+@threaded_tool(name="search_todos")
+@retry_on_db_error
 def search_todos(query: str) -> str:
     """Search todos by title or notes.
 
@@ -486,16 +568,15 @@ def search_todos(query: str) -> str:
     ----
         query: Search term to look for in todo titles and notes
     """
-    todos = things.search(query, include_items=True)
+    todos = things.search(query, include_items=True, database=things_db())
 
     if not todos:
         return f"No todos found matching '{query}'"
 
-    formatted_todos = [format_todo(todo) for todo in todos]
-    return "\n\n---\n\n".join(formatted_todos)
+    return _SEP.join(format_todo(todo) for todo in todos)
 
 
-@mcp.tool(name="search_advanced")
+@threaded_tool(name="search_advanced")
 def search_advanced(
     status: str | None = None,
     start_date: str | None = None,
@@ -534,13 +615,12 @@ def search_advanced(
 
     # Execute search with applicable filters
     try:
-        todos = things.todos(**kwargs)
+        todos = things.todos(**kwargs, database=things_db())
 
         if not todos:
             return "No items found matching your search criteria"
 
-        formatted_todos = [format_todo(todo) for todo in todos]
-        return "\n\n---\n\n".join(formatted_todos)
+        return _SEP.join(format_todo(todo) for todo in todos)
     except Exception as e:
         return f"Error in advanced search: {e!s}"
 
@@ -548,7 +628,7 @@ def search_advanced(
 # MODIFICATION OPERATIONS
 
 
-@mcp.tool(name="add_todo")
+@threaded_tool(name="add_todo")
 def add_task(
     title: str,
     notes: str | None = None,
@@ -575,26 +655,19 @@ def add_task(
     """
     try:
         # Debug: Log all input parameters
-        logger.debug("MCP add_todo called with parameters:")
-        logger.debug(f"  title: {title!r}")
-        logger.debug(f"  notes: {notes!r}")
-        logger.debug(f"  when: {when!r}")
-        logger.debug(f"  deadline: {deadline!r}")
-        logger.debug(f"  tags: {tags!r} (type: {type(tags)})")
-        logger.debug(f"  list_id: {list_id!r}")
-        logger.debug(f"  list_title: {list_title!r}")
+        logger.debug(f"MCP add_todo called with: {_format_params(locals())}")
 
         # Preprocess parameters to handle MCP array serialization issues
         params = preprocess_array_params(tags=tags)
         tags = params["tags"]
         logger.debug(f"  processed tags: {tags!r} (type: {type(tags)})")
 
-        # Clean up title and notes to handle URL encoding
+        # Clean up title and notes to handle URL encoding; escape_applescript_string turns "+" into spaces
         if isinstance(title, str):
-            title = title.replace("+", " ").replace("%20", " ")
+            title = title.replace("%20", " ")
 
         if isinstance(notes, str):
-            notes = notes.replace("+", " ").replace("%20", " ")
+            notes = notes.replace("%20", " ")
 
         # Use the direct AppleScript approach which is more reliable
         logger.info(f"Creating todo using AppleScript: {title}")
@@ -610,20 +683,18 @@ def add_task(
             return "⚠️ Error: Failed to create todo using AppleScript"
 
         # Check if the returned value is actually an error message rather than a valid task ID
-        if isinstance(task_id, str) and ("script error" in task_id or task_id.startswith("/var/folders/") or task_id.startswith("Error:")):
+        if isinstance(task_id, str) and task_id.startswith("Error:"):
             logger.error("AppleScript returned error instead of task ID: %s", task_id)
             return f"⚠️ AppleScript error: {task_id}"
 
         # Get location information for the success message
         try:
-            import things
-
-            todo = things.get(task_id)
+            todo = things.get(task_id, database=things_db())
             if todo:
                 if todo.get("project"):
-                    location = f"Project: {things.get(todo['project'])['title']}"
+                    location = f"Project: {things.get(todo['project'], database=things_db())['title']}"
                 elif todo.get("area"):
-                    location = f"Area: {things.get(todo['area'])['title']}"
+                    location = f"Area: {things.get(todo['area'], database=things_db())['title']}"
                 else:
                     location = f"List: {todo.get('start', 'Unknown')}"
             else:
@@ -641,7 +712,50 @@ def add_task(
         return f"⚠️ Error creating todo: {e!s}"
 
 
-@mcp.tool(name="add_project")
+@threaded_tool(name="add_todos")
+def add_tasks(todos: list[dict] | str) -> str:
+    """Create several todos in Things at once.
+
+    Much faster than repeated add_todo calls, since the whole batch is created
+    in a single AppleScript run.
+
+    Args:
+    ----
+        todos: Array of todo objects. Each needs a "title" and may set "notes",
+            "when", "deadline", "tags", "list_id" and "list_title", with the same
+            meaning as the add_todo parameters. "tags" must be an array of strings.
+    """
+    try:
+        todos = preprocess_array_params(todos=todos)["todos"]
+        if not isinstance(todos, list) or not todos:
+            return "⚠️ Error: todos must be a non-empty array of todo objects"
+
+        specs = []
+        for index, todo in enumerate(todos, start=1):
+            if not isinstance(todo, dict) or not str(todo.get("title") or "").strip():
+                return f"⚠️ Error: todo #{index} must be an object with a non-empty title"
+
+            spec = {key: todo.get(key) for key in ("title", "notes", "when", "deadline", "tags", "list_id", "list_title")}
+            spec["tags"] = preprocess_array_params(tags=spec["tags"])["tags"]
+            # Clean up title and notes to handle URL encoding, as add_todo does
+            for key in ("title", "notes"):
+                value = spec[key]
+                if isinstance(value, str):
+                    spec[key] = value.replace("%20", " ")
+            specs.append(spec)
+
+        logger.info(f"Creating {len(specs)} todos using AppleScript")
+        task_ids = add_todos(specs)
+
+        lines = [f"✅ Created todo: {spec['title']} (ID: {task_id})" if task_id else f"⚠️ Failed to create todo: {spec['title']}" for spec, task_id in zip(specs, task_ids, strict=True)]
+        return "\n".join(lines)
+
+    except Exception as e:
+        logger.error(f"Error creating todos: {e!s}")
+        return f"⚠️ Error creating todos: {e!s}"
+
+
+@threaded_tool(name="add_project")
 def add_new_project(
     title: str,
     notes: str | None = None,
@@ -675,10 +789,10 @@ def add_new_project(
 
         # Clean up title and notes to handle URL encoding
         if isinstance(title, str):
-            title = title.replace("+", " ").replace("%20", " ")
+            title = title.replace("%20", " ")
 
         if isinstance(notes, str):
-            notes = notes.replace("+", " ").replace("%20", " ")
+            notes = notes.replace("%20", " ")
 
         # Use the direct AppleScript approach which is more reliable
         logger.info(f"Creating project using AppleScript: {title}")
@@ -695,12 +809,10 @@ def add_new_project(
 
         # Look up the project to get location information
         try:
-            import things
-
-            project = things.get(project_id)
+            project = things.get(project_id, database=things_db())
             if project:
                 if project.get("area"):
-                    location = f"Area: {things.get(project['area'])['title']}"
+                    location = f"Area: {things.get(project['area'], database=things_db())['title']}"
                 else:
                     location = "List: Inbox"
             else:
@@ -718,7 +830,7 @@ def add_new_project(
         return f"⚠️ Error creating project: {e!s}"
 
 
-@mcp.tool(name="update_todo")
+@threaded_tool(name="update_todo")
 def update_task(
     id: str,
     title: str | None = None,
@@ -754,11 +866,11 @@ def update_task(
 
         # Clean up string parameters to handle URL encoding
         if isinstance(title, str):
-            title = title.replace("+", " ").replace("%20", " ")
+            title = title.replace("%20", " ")
         if isinstance(notes, str):
-            notes = notes.replace("+", " ").replace("%20", " ")
+            notes = notes.replace("%20", " ")
         if isinstance(list_name, str):
-            list_name = list_name.replace("+", " ").replace("%20", " ")
+            list_name = list_name.replace("%20", " ")
 
         logger.info(f"Updating todo using AppleScript: {id}")
 
@@ -801,7 +913,7 @@ def update_task(
         return f"⚠️ Error updating todo: {e!s}"
 
 
-@mcp.tool(name="update_project")
+@threaded_tool(name="update_project")
 def update_existing_project(
     id: str,
     title: str | None = None,
@@ -839,10 +951,7 @@ def update_existing_project(
     """
     try:
         # Log all input parameters for debugging
-        logger.info("Raw input parameters for update_project:")
-        for param_name, param_value in locals().items():
-            if param_name != "self":  # Skip self parameter
-                logger.info(f"  {param_name}: {param_value!r}")
+        logger.info(f"Raw input parameters for update_project: {_format_params(locals())}")
 
         # Preprocess only the tags parameter
         params = preprocess_array_params(tags=tags)
@@ -850,11 +959,11 @@ def update_existing_project(
 
         # Clean up string parameters to handle URL encoding
         if isinstance(title, str):
-            title = title.replace("+", " ").replace("%20", " ")
+            title = title.replace("%20", " ")
         if isinstance(notes, str):
-            notes = notes.replace("+", " ").replace("%20", " ")
+            notes = notes.replace("%20", " ")
         if isinstance(area_title, str):
-            area_title = area_title.replace("+", " ").replace("%20", " ")
+            area_title = area_title.replace("%20", " ")
             logger.info(f"Cleaned area_title: {area_title!r}")
 
         # Use the direct AppleScript approach which is more reliable
@@ -900,7 +1009,7 @@ def update_existing_project(
         return f"⚠️ Error updating project: {e!s}"
 
 
-@mcp.tool(name="show_item")
+@threaded_tool(name="show_item")
 def show_item(id: str, query: str | None = None, filter_tags: list[str] | None = None) -> str:
     """Show a specific item or list in Things.
 
@@ -931,7 +1040,7 @@ def show_item(id: str, query: str | None = None, filter_tags: list[str] | None =
         else:
             # For specific item IDs, try to get the item
             try:
-                item = things.get(id)
+                item = things.get(id, database=things_db())
                 if item:
                     if item.get("type") == "to-do":
                         return format_todo(item)
@@ -950,7 +1059,7 @@ def show_item(id: str, query: str | None = None, filter_tags: list[str] | None =
         return f"Error showing item: {e!s}"
 
 
-@mcp.tool(name="search_items")
+@threaded_tool(name="search_items")
 def search_all_items(query: str) -> str:
     """Search for items in Things.
 
@@ -960,19 +1069,18 @@ def search_all_items(query: str) -> str:
     """
     try:
         # Use the Python things library for search (same as search_todos)
-        todos = things.search(query, include_items=True)
+        todos = things.search(query, include_items=True, database=things_db())
 
         if not todos:
             return f"No items found matching '{query}'"
 
-        formatted_todos = [format_todo(todo) for todo in todos]
-        return "\n\n---\n\n".join(formatted_todos)
+        return _SEP.join(format_todo(todo) for todo in todos)
     except Exception as e:
         logger.error(f"Error searching: {e!s}")
         return f"Error searching: {e!s}"
 
 
-@mcp.tool(name="get_recent")
+@threaded_tool(name="get_recent")
 def get_recent(period: str) -> str:
     """Get recently created items.
 
@@ -982,23 +1090,16 @@ def get_recent(period: str) -> str:
     """
     try:
         # Check if period format is valid
-        if not period or not any(period.endswith(unit) for unit in ["d", "w", "m", "y"]):
+        if not period or period[-1] not in _PERIOD_UNITS or not period[:-1].isdecimal():
             return "Error: Period must be in format '3d', '1w', '2m', '1y'"
 
         # Get recent items
-        items = things.last(period, include_items=True)
+        items = things.last(period, include_items=True, database=things_db())
 
         if not items:
             return f"No items found in the last {period}"
 
-        formatted_items = []
-        for item in items:
-            if item.get("type") == "to-do":
-                formatted_items.append(format_todo(item))
-            elif item.get("type") == "project":
-                formatted_items.append(format_project(item, include_items=False))
-
-        return "\n\n---\n\n".join(formatted_items)
+        return _SEP.join(format_todo(item) if item.get("type") == "to-do" else format_project(item, include_items=False) for item in items if item.get("type") in ("to-do", "project"))
     except Exception as e:
         logger.error(f"Error getting recent items: {e!s}")
         return f"Error getting recent items: {e!s}"
@@ -1007,6 +1108,9 @@ def get_recent(period: str) -> str:
 # Main entry point
 def run_things_mcp_server():
     """Run the Things MCP server."""
+    # Configure enhanced logging here rather than at import, so importing this module has no side effects
+    setup_logging(console_level="INFO", file_level="DEBUG", structured_logs=True)
+
     # Check if Things app is available
     if ensure_things_ready():
         logger.info("Things app is running and ready for operations")
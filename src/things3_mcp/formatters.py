@@ -8,9 +8,28 @@ import logging
 
 import things
 
+from .database import things_db
+
 logger = logging.getLogger(__name__)
 
 
+def _parent_title(item: dict, kind: str) -> str | None:
+    """Return the title of an item's project or area.
+
+    Rows from things.py already carry it as ``project_title``/``area_title``;
+    it is only looked up when the row doesn't have it.
+    """
+    title = item.get(f"{kind}_title")
+    if title is None:
+        try:
+            parent = things.get(item[kind], database=things_db())
+            if parent:
+                title = parent["title"]
+        except Exception:  # nosec B110 - Ignore missing project/area info
+            pass
+    return title
+
+
 def format_todo(todo: dict) -> str:
     """Helper function to format a single todo into a readable string."""
     logger.debug(f"Formatting todo: {todo}")
@@ -44,21 +63,15 @@ def format_todo(todo: dict) -> str:
 
     # Add project info if present
     if todo.get("project"):
-        try:
-            project = things.get(todo["project"])
-            if project:
-                todo_text += f"\nProject: {project['title']}"
-        except Exception:  # nosec B110 - Ignore missing project info, not all todos have projects
-            pass
+        project_title = _parent_title(todo, "project")
+        if project_title:
+            todo_text += f"\nProject: {project_title}"
 
     # Add area info if present
     if todo.get("area"):
-        try:
-            area = things.get(todo["area"])
-            if area:
-                todo_text += f"\nArea: {area['title']}"
-        except Exception:  # nosec B110 - Ignore missing area info, not all todos have areas
-            pass
+        area_title = _parent_title(todo, "area")
+        if area_title:
+            todo_text += f"\nArea: {area_title}"
 
     # Add tags if present
     if todo.get("tags"):
@@ -79,18 +92,15 @@ def format_project(project: dict, include_items: bool = False) -> str:
     project_text = f"Title: {project['title']}\nUUID: {project['uuid']}"
 
     if project.get("area"):
-        try:
-            area = things.get(project["area"])
-            if area:
-                project_text += f"\nArea: {area['title']}"
-        except Exception:  # nosec B110 - Ignore missing area info, not all projects have areas
-            pass
+        area_title = _parent_title(project, "area")
+        if area_title:
+            project_text += f"\nArea: {area_title}"
 
     if project.get("notes"):
         project_text += f"\nNotes: {project['notes']}"
 
     if include_items:
-        todos = things.todos(project=project["uuid"])
+        todos = things.todos(project=project["uuid"], database=things_db())
         if todos:
             project_text += "\n\nTasks:"
             for todo in todos:
@@ -107,13 +117,13 @@ def format_area(area: dict, include_items: bool = False) -> str:
         area_text += f"\nNotes: {area['notes']}"
 
     if include_items:
-        projects = things.projects(area=area["uuid"])
+        projects = things.projects(area=area["uuid"], database=things_db())
         if projects:
             area_text += "\n\nProjects:"
             for project in projects:
                 area_text += f"\n- {project['title']}"
 
-        todos = things.todos(area=area["uuid"])
+        todos = things.todos(area=area["uuid"], database=things_db())
         if todos:
             area_text += "\n\nTasks:"
             for todo in todos:
@@ -130,7 +140,7 @@ def format_tag(tag: dict, include_items: bool = False) -> str:
         tag_text += f"\nShortcut: {tag['shortcut']}"
 
     if include_items:
-        todos = things.todos(tag=tag["title"])
+        todos = things.todos(tag=tag["title"], database=things_db())
         if todos:
             tag_text += "\n\nTagged Items:"
             for todo in todos:
@@ -4,15 +4,66 @@
 Provides structured logging with multiple outputs and log levels.
 """
 
+import atexit
 import json
 import logging
 import logging.handlers
-from datetime import UTC, datetime
+import os
+import queue
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from json.encoder import encode_basestring_ascii as _encode_str
 from pathlib import Path
 
-# Create logs directory if it doesn't exist
+# Directory for log files; created on demand by setup_logging()
 LOGS_DIR = Path.home() / ".things-mcp" / "logs"
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
+
+# Level names accepted by setup_logging(), resolved without attribute lookups on the logging module
+_LEVEL_MAP = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+    # Aliases the logging module also accepts
+    "WARN": logging.WARNING,
+    "FATAL": logging.CRITICAL,
+    "NOTSET": logging.NOTSET,
+}
+
+
+# Formatters shared by every setup_logging() call
+_CONSOLE_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+_TEXT_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - [%(funcName)s:%(lineno)d] - %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+
+# Optional record attributes copied into structured logs, in output order
+_EXTRA_FIELDS = ("operation", "duration", "error_type", "retry_count")
+
+
+# Most recent (second, "YYYY-MM-DDTHH:MM:SS") pair, reused for records logged within the same second
+_timestamp_cache: tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(record: logging.LogRecord) -> str:
+    """Return the record's creation time exactly as ``datetime.isoformat()`` renders it in UTC."""
+    global _timestamp_cache
+    secs, micros = divmod(round(record.created * 1_000_000), 1_000_000)
+    cached_secs, base = _timestamp_cache
+    if secs != cached_secs:
+        base = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs))
+        _timestamp_cache = (secs, base)
+    # isoformat() leaves out the fraction when there are no microseconds
+    return f"{base}.{micros:06d}+00:00" if micros else f"{base}+00:00"
+
+
+def _record_message(record: logging.LogRecord) -> str:
+    """Return the record's message, skipping %-formatting when there are no args."""
+    msg = record.msg
+    if not record.args and isinstance(msg, str):
+        return msg
+    return record.getMessage()
 
 
 class StructuredFormatter(logging.Formatter):
@@ -27,48 +78,110 @@ class StructuredFormatter(logging.Formatter):
         Returns:
             str: The formatted log record as a JSON string.
         """
+        # Render the fixed keys directly instead of building a dict for json.dumps;
+        # only the variable values need escaping.
+        parts = [
+            f'{{"timestamp": "{_format_timestamp(record)}", "level": "{record.levelname}", "logger": {_encode_str(record.name)}, '
+            f'"message": {_encode_str(_record_message(record))}, "module": {_encode_str(record.module)}, "function": {_encode_str(record.funcName) if record.funcName is not None else "null"}, "line": {record.lineno}'
+        ]
+
+        # Add any extra fields
+        for key in _EXTRA_FIELDS:
+            if key in record.__dict__:
+                parts.append(f', "{key}": {json.dumps(record.__dict__[key])}')
+
+        # Add exception info if present
+        if record.exc_info:
+            parts.append(f', "exception": {_encode_str(self.formatException(record.exc_info))}')
+
+        parts.append("}")
+        return "".join(parts)
+
+    def build_log_data(self, record: logging.LogRecord) -> dict:
+        """Collect the structured fields for a log record.
+
+        Args:
+            record: The log record to convert.
+
+        Returns:
+            dict: The structured log fields.
+        """
         log_data = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": _format_timestamp(record),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": _record_message(record),
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
         }
 
         # Add any extra fields
-        if hasattr(record, "operation"):
-            log_data["operation"] = record.operation
-        if hasattr(record, "duration"):
-            log_data["duration"] = record.duration
-        if hasattr(record, "error_type"):
-            log_data["error_type"] = record.error_type
-        if hasattr(record, "retry_count"):
-            log_data["retry_count"] = record.retry_count
+        for key in _EXTRA_FIELDS:
+            if key in record.__dict__:
+                log_data[key] = record.__dict__[key]
 
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data)
+        return log_data
+
+
+class BinaryStructuredFormatter(StructuredFormatter):
+    """Formatter that encodes structured logs as length-prefixed msgpack frames.
+
+    Each frame is a 4-byte big-endian length followed by the msgpack payload,
+    which can be decoded with ``msgpack.unpackb(payload, raw=False)``.
+    """
+
+    def __init__(self):
+        """Initialize the formatter, importing msgpack (the ``binary-logs`` extra) on demand."""
+        super().__init__()
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImportError("Binary structured logs require msgpack; install it with the 'binary-logs' extra (pip install 'Things3-MCP-server[binary-logs]')") from e
+
+        self._packb = msgpack.packb
+
+    def format_frame(self, record: logging.LogRecord) -> bytes:
+        """Encode a log record as a length-prefixed msgpack frame.
+
+        Args:
+            record: The log record to encode.
+
+        Returns:
+            bytes: The encoded frame.
+        """
+        payload = self._packb(self.build_log_data(record), use_bin_type=True, default=str)
+        return struct.pack(">I", len(payload)) + payload
 
 
 class OperationLogFilter(logging.Filter):
-    """Filter to add operation context to log records."""
+    """Filter to add operation context to log records.
+
+    The context is stored per thread so that concurrent MCP requests don't
+    overwrite each other's operation details.
+    """
 
     def __init__(self):
         """Initialize the operation log filter."""
         super().__init__()
-        self.operation_context = {}
+        self._tls = threading.local()
+
+    @property
+    def operation_context(self) -> dict:
+        """Return the operation context for the current thread."""
+        return getattr(self._tls, "ctx", None) or {}
 
     def set_operation_context(self, operation: str, **kwargs):
         """Set the current operation context."""
-        self.operation_context = {"operation": operation, **kwargs}
+        self._tls.ctx = {"operation": operation, **kwargs}
 
     def clear_operation_context(self):
         """Clear the operation context."""
-        self.operation_context = {}
+        self._tls.ctx = None
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Add operation context to log records.
@@ -79,20 +192,205 @@ class OperationLogFilter(logging.Filter):
         Returns:
             bool: Always returns True to allow the record.
         """
-        # Add operation context to the record
-        for key, value in self.operation_context.items():
-            setattr(record, key, value)
+        # Add operation context to the record (written straight into __dict__ to skip setattr)
+        ctx = getattr(self._tls, "ctx", None)
+        if ctx:
+            record.__dict__.update(ctx)
         return True
 
 
+class BackgroundRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that performs rollover on a worker thread.
+
+    Records keep going to the current stream while the backups are renamed and
+    the new file is opened; the new stream is swapped in under the handler lock.
+    """
+
+    def __init__(self, filename, maxBytes: int = 0, backupCount: int = 0, encoding: str | None = None):  # noqa: N803
+        """Initialize the handler and its single rotation worker."""
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding)
+        self._rotation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-rotation")
+        self._rotation_pending = False
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:  # noqa: N802
+        """Schedule a background rollover once the file is full; never roll over inline.
+
+        Args:
+            record: The log record about to be written.
+
+        Returns:
+            bool: Always False, so emit() never blocks on rotation.
+        """
+        if self.maxBytes > 0 and self.backupCount > 0 and not self._rotation_pending and self.stream is not None and self.stream.tell() >= self.maxBytes:
+            self._rotation_pending = True
+            self._rotation_executor.submit(self._rotate_in_background)
+        return False
+
+    def _rotate_in_background(self) -> None:
+        try:
+            # Renaming is safe while the old stream is open; its writes follow the file to ".1"
+            for i in range(self.backupCount - 1, 0, -1):
+                source = self.rotation_filename(f"{self.baseFilename}.{i}")
+                dest = self.rotation_filename(f"{self.baseFilename}.{i + 1}")
+                if os.path.exists(source):
+                    if os.path.exists(dest):
+                        os.remove(dest)
+                    os.rename(source, dest)
+            dest = self.rotation_filename(f"{self.baseFilename}.1")
+            if os.path.exists(dest):
+                os.remove(dest)
+            self.rotate(self.baseFilename, dest)
+
+            new_stream = self._open()
+            self.acquire()
+            try:
+                old_stream, self.stream = self.stream, new_stream
+                if old_stream is not None:
+                    old_stream.close()
+            finally:
+                self.release()
+        finally:
+            self._rotation_pending = False
+
+    def close(self) -> None:
+        """Wait for any pending rotation before closing the handler."""
+        self._rotation_executor.shutdown(wait=True)
+        super().close()
+
+
+class DirectWriteRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that writes each record straight to the file with ``os.write``.
+
+    Used for the error-only log: errors are rare, so the buffered stream layer
+    adds overhead without ever batching anything.
+    """
+
+    def __init__(self, filename, maxBytes: int = 0, backupCount: int = 0, encoding: str = "utf-8"):  # noqa: N803
+        """Initialize the handler without opening a Python stream."""
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding, delay=True)
+        self._fd: int | None = None
+
+    def _get_fd(self) -> int:
+        if self._fd is None:
+            self._fd = os.open(self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return self._fd
+
+    def _close_fd(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def encode_record(self, record: logging.LogRecord) -> bytes:
+        """Encode a record as the bytes to append to the log file.
+
+        Args:
+            record: The log record to encode.
+
+        Returns:
+            bytes: The encoded record.
+        """
+        return (self.format(record) + self.terminator).encode(self.encoding or "utf-8")
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record to the log file, rotating first if it would exceed maxBytes.
+
+        Args:
+            record: The log record to write.
+        """
+        try:
+            data = self.encode_record(record)
+            if self.maxBytes > 0 and os.fstat(self._get_fd()).st_size + len(data) >= self.maxBytes:
+                self.doRollover()
+            fd = self._get_fd()
+            view = memoryview(data)
+            # os.write may accept only part of the buffer; keep going so records are never truncated
+            while view:
+                view = view[os.write(fd, view) :]
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self) -> None:  # noqa: N802
+        """Close the cached file descriptor before rotating the log files."""
+        self._close_fd()
+        super().doRollover()
+
+    def close(self) -> None:
+        """Close the cached file descriptor along with the handler."""
+        self.acquire()
+        try:
+            self._close_fd()
+        finally:
+            self.release()
+        super().close()
+
+
+class BinaryRotatingFileHandler(DirectWriteRotatingFileHandler):
+    """Rotating file handler that writes length-prefixed msgpack frames."""
+
+    def __init__(self, filename, formatter: BinaryStructuredFormatter, maxBytes: int = 0, backupCount: int = 0):  # noqa: N803
+        """Initialize the handler with the formatter that encodes its frames."""
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount)
+        # Typed reference for format_frame(); Handler.formatter is only known to be a Formatter
+        self._frame_formatter = formatter
+        self.setFormatter(formatter)
+
+    def encode_record(self, record: logging.LogRecord) -> bytes:
+        """Encode a record as a msgpack frame.
+
+        Args:
+            record: The log record to encode.
+
+        Returns:
+            bytes: The encoded frame.
+        """
+        return self._frame_formatter.format_frame(record)
+
+
+class InProcessQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that passes records through unchanged.
+
+    The listener runs in the same process, so there's no need to pre-format
+    records for pickling. Keeping ``exc_info`` intact lets the structured
+    formatter still emit a separate ``exception`` field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return the record as-is for the background listener.
+
+        Args:
+            record: The log record to enqueue.
+
+        Returns:
+            logging.LogRecord: The unchanged record.
+        """
+        return record
+
+
 # Global operation filter instance
 operation_filter = OperationLogFilter()
 
+# Background listener that writes queued records to the console and log files
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background logging thread, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 def setup_logging(
     console_level: str = "INFO",
     file_level: str = "DEBUG",
     structured_logs: bool = True,
+    binary_structured_logs: bool = False,
     max_bytes: int = 10 * 1024 * 1024,  # 10MB
     backup_count: int = 5,
 ) -> None:
@@ -103,51 +401,84 @@ def setup_logging(
         console_level: Log level for console output
         file_level: Log level for file output
         structured_logs: Whether to use structured JSON logging
+        binary_structured_logs: Write structured logs as msgpack frames instead of JSON (requires msgpack)
         max_bytes: Maximum size of log files before rotation
         backup_count: Number of backup files to keep
     """
+    global _queue_listener
+
+    # Create logs directory if it doesn't exist
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Resolve numeric levels once
+    console_levelno = _LEVEL_MAP[console_level.upper()]
+    file_levelno = _LEVEL_MAP[file_level.upper()]
+
     # Get the root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)  # Capture everything, filter at handler level
 
     # Remove existing handlers
     root_logger.handlers.clear()
+    _stop_queue_listener()
 
     # Console handler with simple formatting
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, console_level.upper()))
-    console_format = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
-    console_handler.setFormatter(console_format)
-    console_handler.addFilter(operation_filter)
-    root_logger.addHandler(console_handler)
+    console_handler.setLevel(console_levelno)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
+    handlers: list[logging.Handler] = [console_handler]
 
     # File handlers with rotation
-    if structured_logs:
+    msgpack_error: ImportError | None = None
+    if structured_logs and binary_structured_logs:
+        try:
+            binary_formatter = BinaryStructuredFormatter()
+        except ImportError as e:
+            binary_formatter = None
+            binary_structured_logs = False
+            msgpack_error = e
+
+        if binary_formatter is not None:
+            # Binary msgpack logs: cheaper to encode and smaller on disk
+            binary_file_handler = BinaryRotatingFileHandler(LOGS_DIR / "things3_mcp_structured.msgpack", binary_formatter, maxBytes=max_bytes, backupCount=backup_count)
+            binary_file_handler.setLevel(file_levelno)
+            handlers.append(binary_file_handler)
+
+    if structured_logs and not binary_structured_logs:
         # Structured JSON logs for analysis
-        json_file_handler = logging.handlers.RotatingFileHandler(LOGS_DIR / "things3_mcp_structured.json", maxBytes=max_bytes, backupCount=backup_count)
-        json_file_handler.setLevel(getattr(logging, file_level.upper()))
+        json_file_handler = BackgroundRotatingFileHandler(LOGS_DIR / "things3_mcp_structured.json", maxBytes=max_bytes, backupCount=backup_count)
+        json_file_handler.setLevel(file_levelno)
         json_file_handler.setFormatter(StructuredFormatter())
-        json_file_handler.addFilter(operation_filter)
-        root_logger.addHandler(json_file_handler)
+        handlers.append(json_file_handler)
 
     # Human-readable file logs
-    text_file_handler = logging.handlers.RotatingFileHandler(LOGS_DIR / "things3_mcp.log", maxBytes=max_bytes, backupCount=backup_count)
-    text_file_handler.setLevel(getattr(logging, file_level.upper()))
-    text_format = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - [%(funcName)s:%(lineno)d] - %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
-    text_file_handler.setFormatter(text_format)
-    text_file_handler.addFilter(operation_filter)
-    root_logger.addHandler(text_file_handler)
+    text_file_handler = BackgroundRotatingFileHandler(LOGS_DIR / "things3_mcp.log", maxBytes=max_bytes, backupCount=backup_count)
+    text_file_handler.setLevel(file_levelno)
+    text_file_handler.setFormatter(_TEXT_FORMATTER)
+    handlers.append(text_file_handler)
 
     # Error-only file handler
-    error_file_handler = logging.handlers.RotatingFileHandler(LOGS_DIR / "things3_mcp_errors.log", maxBytes=max_bytes, backupCount=backup_count)
+    error_file_handler = DirectWriteRotatingFileHandler(LOGS_DIR / "things3_mcp_errors.log", maxBytes=max_bytes, backupCount=backup_count)
     error_file_handler.setLevel(logging.ERROR)
-    error_file_handler.setFormatter(text_format)
-    error_file_handler.addFilter(operation_filter)
-    root_logger.addHandler(error_file_handler)
+    error_file_handler.setFormatter(_TEXT_FORMATTER)
+    handlers.append(error_file_handler)
+
+    # Write all output from a background thread so tool calls never block on I/O.
+    # The root logger gets a single queue handler, so the operation filter runs once
+    # per record, in the caller's thread where the thread-local context is available.
+    # (A filter on the root logger itself would skip records from child loggers.)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = InProcessQueueHandler(log_queue)
+    queue_handler.addFilter(operation_filter)
+    root_logger.addHandler(queue_handler)
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
 
     # Log the logging configuration
     logger = logging.getLogger(__name__)
-    logger.info(f"Logging configured - Console: {console_level}, File: {file_level}, Structured: {structured_logs}")
+    if msgpack_error is not None:
+        logger.warning(f"{msgpack_error}; falling back to JSON structured logs")
+    logger.info(f"Logging configured - Console: {console_level}, File: {file_level}, Structured: {structured_logs}, Binary: {binary_structured_logs}")
     logger.info(f"Log files location: {LOGS_DIR}")
 
 
@@ -176,7 +507,3 @@ def log_operation_end(operation: str, success: bool, duration: float = None, **k
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with the given name."""
     return logging.getLogger(name)
-
-
-# Initialize logging when module is imported
-setup_logging()
@@ -3,6 +3,7 @@
 
 import os
 import random
+import re
 import string
 import sys
 
@@ -10,14 +11,36 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 import pytest  # noqa: E402
+from things.database import make_tasks_sql_query  # noqa: E402
 
 from things3_mcp.applescript_bridge import (  # noqa: E402
     ensure_things_ready,
+    escape_applescript_string,
     run_applescript,
 )
+from things3_mcp.database import things_db  # noqa: E402
 
-# Test namespace for tags and areas - centralized here for all tests
-TEST_NAMESPACE = "mcp-test"
+# Test namespace for tags and areas - centralized here for all tests.
+# Under pytest-xdist each worker (gw0, gw1, ...) gets its own fixed-width namespace,
+# so one worker's cleanup never matches another worker's items by prefix.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+TEST_NAMESPACE = f"mcp-test-w{int(_XDIST_WORKER.removeprefix('gw')):02d}" if _XDIST_WORKER else "mcp-test"
+
+
+def pytest_addoption(parser):
+    """Register the --verify-cleanup option."""
+    parser.addoption(
+        "--verify-cleanup",
+        action="store_true",
+        default=False,
+        help="Scan Things for leftover test items after every test, not just at the end of the session",
+    )
+
+
+_RANDOM_ALPHABET = string.ascii_letters + string.digits
+
+# TMTask.type values used by things.py
+_TASK_TYPES = {"to-do": 0, "project": 1}
 
 
 def generate_random_string(length: int = 10) -> str:
@@ -29,7 +52,42 @@ def generate_random_string(length: int = 10) -> str:
     Returns:
         A random string containing letters and digits.
     """
-    return "".join(random.choices(string.ascii_letters + string.digits, k=length))
+    return "".join(random.choices(_RANDOM_ALPHABET, k=length))
+
+
+def get_items_by_ids(*item_ids: str) -> dict[str, dict]:
+    """Fetch several todos/projects with a single database query.
+
+    Args:
+        *item_ids: UUIDs of the todos or projects to fetch.
+
+    Returns:
+        A dict mapping each UUID that was found to its task row, whatever its status.
+    """
+    placeholders = ", ".join("?" * len(item_ids))
+    rows = things_db().execute_query(make_tasks_sql_query(f"TASK.uuid IN ({placeholders})"), item_ids)
+    return {row["uuid"]: row for row in rows}
+
+
+def find_namespaced_tasks(task_type: str) -> list[dict]:
+    """Find open test todos or projects with the namespace filter applied in SQLite.
+
+    Args:
+        task_type: Either "to-do" or "project".
+
+    Returns:
+        Task rows whose title starts with the test namespace.
+    """
+    where = f"TASK.type = {_TASK_TYPES[task_type]} AND TASK.trashed = 0 AND TASK.status = 0 AND TASK.title LIKE ?"
+    rows = things_db().execute_query(make_tasks_sql_query(where), (f"{TEST_NAMESPACE}%",))
+    # LIKE is case-insensitive, so keep only exact prefix matches
+    return [row for row in rows if row["title"].startswith(TEST_NAMESPACE)]
+
+
+@pytest.fixture()
+def uid():
+    """Fixture to provide one random suffix for all the titles a test creates."""
+    return generate_random_string(5)
 
 
 @pytest.fixture()
@@ -38,40 +96,83 @@ def test_namespace():
     return TEST_NAMESPACE
 
 
-def create_test_tag(tag_name: str) -> bool:
-    """Create a test tag with the MCP namespace."""
-    full_tag_name = f"{TEST_NAMESPACE}-{tag_name}"
-    script = f"""
+# Fixed helper scripts take their values through argv rather than being rebuilt per call
+_CREATE_TAG_SCRIPT = """
+on run argv
     tell application "Things3"
-        set newTag to make new tag with properties {{name:"{full_tag_name}"}}
+        set newTag to make new tag with properties {name:item 1 of argv}
         return id of newTag
     end tell
-    """
-    result = run_applescript(script)
-    return result and "error" not in result.lower()
+end run
+"""
 
+_CREATE_AREA_SCRIPT = """
+on run argv
+    tell application "Things3"
+        set newArea to make new area with properties {name:item 1 of argv}
+        return id of newArea
+    end tell
+end run
+"""
 
-def delete_test_tags():
-    """Delete all test tags with the MCP namespace."""
-    script = f"""
+_DELETE_TODO_SCRIPT = """
+on run argv
     tell application "Things3"
         try
+            delete to do id (item 1 of argv)
+            return "success"
+        on error errMsg
+            return "Error: " & errMsg
+        end try
+    end tell
+end run
+"""
+
+_DELETE_PROJECT_SCRIPT = """
+on run argv
+    tell application "Things3"
+        try
+            delete project id (item 1 of argv)
+            return "success"
+        on error errMsg
+            return "Error: " & errMsg
+        end try
+    end tell
+end run
+"""
+
+
+def create_test_tag(tag_name: str) -> bool:
+    """Create a test tag with the MCP namespace."""
+    result = run_applescript(_CREATE_TAG_SCRIPT, args=(f"{TEST_NAMESPACE}-{tag_name}",))
+    return result and "error" not in result.lower()
+
+
+# Collects and deletes namespaced tags; shared with the batched cleanup script
+_TAG_CLEANUP = f"""
             set tagList to {{}}
             repeat with theTag in tags
                 if name of theTag starts with "{TEST_NAMESPACE}-" then
-                    set end of tagList to id of theTag
+                    set end of tagList to tag id (id of theTag)
                 end if
             end repeat
 
-            repeat with tagId in tagList
+            repeat with tagRef in tagList
                 try
-                    set theTag to first tag whose id is tagId
-                    delete theTag
+                    delete (contents of tagRef)
                 on error
                     -- Tag might already be deleted, continue
                 end try
             end repeat
+"""
 
+
+def delete_test_tags():
+    """Delete all test tags with the MCP namespace."""
+    script = f"""
+    tell application "Things3"
+        try
+{_TAG_CLEANUP}
             return "success"
         on error errMsg
             return "Error: " & errMsg
@@ -86,76 +187,67 @@ def delete_test_tags():
 
 
 def create_test_area(area_name: str) -> str:
-    """Create a test area with the MCP namespace."""
-    full_area_name = f"{TEST_NAMESPACE}-{area_name}"
-    script = f"""
-    tell application "Things3"
-        set newArea to make new area with properties {{name:"{full_area_name}"}}
-        return id of newArea
-    end tell
-    """
-    result = run_applescript(script)
+    """Create a test area named f"{TEST_NAMESPACE}-{area_name}" and return its ID."""
+    result = run_applescript(_CREATE_AREA_SCRIPT, args=(f"{TEST_NAMESPACE}-{area_name}",))
     if result and "error" not in result.lower():
         return result
     return None
 
 
-def rename_test_area(area_id: str, new_name: str) -> bool:
-    """Rename a test area."""
-    script = f"""
-    tell application "Things3"
-        try
-            set theArea to first area whose id is "{area_id}"
-            set name of theArea to "{new_name}"
-            return "success"
-        on error errMsg
-            return "Error: " & errMsg
-        end try
-    end tell
-    """
-    result = run_applescript(script)
-    return result and "error" not in result.lower()
-
-
 def delete_todo_by_id(todo_id: str) -> bool:
     """Delete a specific todo by ID."""
-    script = f"""
-    tell application "Things3"
-        try
-            set theTodo to first to do whose id is "{todo_id}"
-            delete theTodo
-            return "success"
-        on error errMsg
-            return "Error: " & errMsg
-        end try
-    end tell
-    """
-    result = run_applescript(script)
+    result = run_applescript(_DELETE_TODO_SCRIPT, args=(todo_id,))
     return result and "error" not in result.lower()
 
 
 def delete_project_by_id(project_id: str) -> bool:
     """Delete a specific project by ID."""
+    result = run_applescript(_DELETE_PROJECT_SCRIPT, args=(project_id,))
+    return result and "error" not in result.lower()
+
+
+def delete_items_by_ids(todo_ids: list[str], project_ids: list[str]) -> bool:
+    """Delete the given todos and projects in a single AppleScript run.
+
+    Args:
+        todo_ids: IDs of the todos to delete.
+        project_ids: IDs of the projects to delete.
+
+    Returns:
+        True if the script ran; items that were already gone are skipped.
+    """
+    if not todo_ids and not project_ids:
+        return True
+
+    todo_list = ", ".join(escape_applescript_string(todo_id) for todo_id in todo_ids)
+    project_list = ", ".join(escape_applescript_string(project_id) for project_id in project_ids)
     script = f"""
     tell application "Things3"
-        try
-            set theProject to first project whose id is "{project_id}"
-            delete theProject
-            return "success"
-        on error errMsg
-            return "Error: " & errMsg
-        end try
+        repeat with todoId in {{{todo_list}}}
+            try
+                delete to do id (contents of todoId)
+            on error
+                -- Todo might already be deleted, continue
+            end try
+        end repeat
+
+        repeat with projectId in {{{project_list}}}
+            try
+                delete project id (contents of projectId)
+            on error
+                -- Project might already be deleted, continue
+            end try
+        end repeat
+
+        return "success"
     end tell
     """
-    result = run_applescript(script)
-    return result and "error" not in result.lower()
+    result = run_applescript(script, timeout=8 + len(todo_ids) + len(project_ids))
+    return result == "success"
 
 
-def verify_cleanup():
-    """Verify that all test items have been cleaned up."""
-    script = f"""
-    tell application "Things3"
-        try
+# Returns "success", or a list of namespaced items that are still present
+_VERIFY_CLEANUP = f"""
             set foundItems to {{}}
 
             -- Check all todos
@@ -199,14 +291,23 @@ def verify_cleanup():
             end repeat
 
             if (count of foundItems) > 0 then
-                set itemList to ""
-                repeat with item in foundItems
-                    set itemList to itemList & item & linefeed
-                end repeat
-                return "Found test items:" & linefeed & itemList
+                -- Convert the list in one step rather than concatenating item by item
+                set AppleScript's text item delimiters to linefeed
+                set itemList to foundItems as text
+                set AppleScript's text item delimiters to ""
+                return "Found test items:" & linefeed & itemList & linefeed
             else
                 return "success"
             end if
+"""
+
+
+def verify_cleanup():
+    """Verify that all test items have been cleaned up."""
+    script = f"""
+    tell application "Things3"
+        try
+{_VERIFY_CLEANUP}
         on error errMsg
             return "Error: " & errMsg
         end try
@@ -221,27 +322,31 @@ def verify_cleanup():
     return True
 
 
-def delete_test_areas():
-    """Delete all test areas with the MCP namespace."""
-    script = f"""
-    tell application "Things3"
-        try
+# Collects and deletes namespaced areas; shared with the batched cleanup script
+_AREA_CLEANUP = f"""
             set areaList to {{}}
             repeat with theArea in areas
                 if name of theArea starts with "{TEST_NAMESPACE}-" then
-                    set end of areaList to id of theArea
+                    set end of areaList to area id (id of theArea)
                 end if
             end repeat
 
-            repeat with areaId in areaList
+            repeat with areaRef in areaList
                 try
-                    set theArea to first area whose id is areaId
-                    delete theArea
+                    delete (contents of areaRef)
                 on error
                     -- Area might already be deleted, continue
                 end try
             end repeat
+"""
+
 
+def delete_test_areas():
+    """Delete all test areas with the MCP namespace."""
+    script = f"""
+    tell application "Things3"
+        try
+{_AREA_CLEANUP}
             return "success"
         on error errMsg
             return "Error: " & errMsg
@@ -255,20 +360,16 @@ def delete_test_areas():
         print(f"⚠️  Area cleanup result: {result}")
 
 
-def delete_test_todos():
-    """Delete all test todos with the MCP namespace from all lists."""
-    # First try the AppleScript approach
-    script = f"""
-    tell application "Things3"
-        try
+# Collects and deletes namespaced todos from every list, project and area
+_TODO_CLEANUP = f"""
             set todoList to {{}}
 
-            -- Get all todos from everywhere
+            -- Every to do, including those inside projects and areas
             set allTodos to every to do
             repeat with theTodo in allTodos
                 try
                     if title of theTodo starts with "{TEST_NAMESPACE}" then
-                        set end of todoList to id of theTodo
+                        set end of todoList to to do id (id of theTodo)
                         log "Found test todo: " & title of theTodo
                     end if
                 on error errMsg
@@ -276,50 +377,10 @@ def delete_test_todos():
                 end try
             end repeat
 
-            -- Also check todos in projects
-            set allProjects to every project
-            repeat with theProject in allProjects
-                try
-                    set projectTodos to to dos of theProject
-                    repeat with theTodo in projectTodos
-                        try
-                            if title of theTodo starts with "{TEST_NAMESPACE}" then
-                                set end of todoList to id of theTodo
-                                log "Found test todo in project: " & title of theTodo
-                            end if
-                        on error errMsg
-                            log "Error checking project todo: " & errMsg
-                        end try
-                    end repeat
-                on error errMsg
-                    log "Error accessing project: " & errMsg
-                end try
-            end repeat
-
-            -- And check todos in areas
-            set allAreas to every area
-            repeat with theArea in allAreas
-                try
-                    set areaTodos to to dos of theArea
-                    repeat with theTodo in areaTodos
-                        try
-                            if title of theTodo starts with "{TEST_NAMESPACE}" then
-                                set end of todoList to id of theTodo
-                                log "Found test todo in area: " & title of theTodo
-                            end if
-                        on error errMsg
-                            log "Error checking area todo: " & errMsg
-                        end try
-                    end repeat
-                on error errMsg
-                    log "Error accessing area: " & errMsg
-                end try
-            end repeat
-
-            -- Delete collected todos
-            repeat with todoId in todoList
+            -- Delete collected todos through their by-id references
+            repeat with todoRef in todoList
                 try
-                    set theTodo to first to do whose id is todoId
+                    set theTodo to contents of todoRef
                     log "Deleting todo: " & title of theTodo
                     -- Check if todo is completed
                     if status of theTodo is "completed" then
@@ -331,7 +392,33 @@ def delete_test_todos():
                     log "Error deleting todo: " & errMsg
                 end try
             end repeat
+"""
 
+
+# Matches the success message of the todo/project cleanup scripts
+_CLEANED_UP_PATTERN = re.compile(r"Successfully cleaned up (\d+) test")
+
+
+def _cleanup_found_nothing(result: str) -> bool:
+    """Return True if a cleanup script failed or reported deleting no items.
+
+    Args:
+        result: Output of the todo or project cleanup script.
+
+    Returns:
+        True if the Python fallback should look for items the script missed.
+    """
+    match = _CLEANED_UP_PATTERN.search(result or "")
+    return match is None or match.group(1) == "0"
+
+
+def delete_test_todos():
+    """Delete all test todos with the MCP namespace from all lists."""
+    # First try the AppleScript approach
+    script = f"""
+    tell application "Things3"
+        try
+{_TODO_CLEANUP}
             return "Successfully cleaned up " & (count of todoList) & " test todos"
         on error errMsg
             return "Error: " & errMsg
@@ -341,20 +428,18 @@ def delete_test_todos():
     result = run_applescript(script)
 
     # If AppleScript cleanup didn't work, try Python-based cleanup as fallback
-    if not result or "error" in result.lower() or "0" in result:
+    if _cleanup_found_nothing(result):
         try:
-            import things
-
-            all_todos = things.todos()
-            test_todos = [t for t in all_todos if t.get("title", "").startswith(TEST_NAMESPACE)]
+            test_todos = find_namespaced_tasks("to-do")
 
             if test_todos:
                 print(f"⚠️  AppleScript cleanup found 0 todos, but Python found {len(test_todos)}. Using Python cleanup...")
-                for todo in test_todos:
-                    try:
-                        delete_todo_by_id(todo["uuid"])
-                    except Exception as e:
-                        print(f"⚠️  Failed to delete todo {todo.get('title', 'unknown')}: {e}")
+                if not delete_items_by_ids([todo["uuid"] for todo in test_todos], []):
+                    for todo in test_todos:
+                        try:
+                            delete_todo_by_id(todo["uuid"])
+                        except Exception as e:
+                            print(f"⚠️  Failed to delete todo {todo.get('title', 'unknown')}: {e}")
                 print(f"✅ Python cleanup completed for {len(test_todos)} todos")
             else:
                 print("✅ No test todos found via Python")
@@ -364,12 +449,8 @@ def delete_test_todos():
         print("✅ Successfully cleaned up test todos via AppleScript")
 
 
-def delete_test_projects():
-    """Delete all test projects with the MCP namespace."""
-    # First try the AppleScript approach
-    script = f"""
-    tell application "Things3"
-        try
+# Collects and deletes namespaced projects
+_PROJECT_CLEANUP = f"""
             set projectList to {{}}
 
             -- Get all projects from everywhere
@@ -377,7 +458,7 @@ def delete_test_projects():
             repeat with theProject in allProjects
                 try
                     if title of theProject starts with "{TEST_NAMESPACE}" then
-                        set end of projectList to id of theProject
+                        set end of projectList to project id (id of theProject)
                         log "Found test project: " & title of theProject
                     end if
                 on error errMsg
@@ -385,10 +466,10 @@ def delete_test_projects():
                 end try
             end repeat
 
-            -- Delete collected projects
-            repeat with projectId in projectList
+            -- Delete collected projects through their by-id references
+            repeat with projectRef in projectList
                 try
-                    set theProject to first project whose id is projectId
+                    set theProject to contents of projectRef
                     log "Deleting project: " & title of theProject
                     -- Check if project is completed
                     if status of theProject is "completed" then
@@ -400,7 +481,16 @@ def delete_test_projects():
                     log "Error deleting project: " & errMsg
                 end try
             end repeat
+"""
+
 
+def delete_test_projects():
+    """Delete all test projects with the MCP namespace."""
+    # First try the AppleScript approach
+    script = f"""
+    tell application "Things3"
+        try
+{_PROJECT_CLEANUP}
             return "Successfully cleaned up " & (count of projectList) & " test projects"
         on error errMsg
             return "Error: " & errMsg
@@ -410,20 +500,18 @@ def delete_test_projects():
     result = run_applescript(script)
 
     # If AppleScript cleanup didn't work, try Python-based cleanup as fallback
-    if not result or "error" in result.lower() or "0" in result:
+    if _cleanup_found_nothing(result):
         try:
-            import things
-
-            all_projects = things.projects()
-            test_projects = [p for p in all_projects if p.get("title", "").startswith(TEST_NAMESPACE)]
+            test_projects = find_namespaced_tasks("project")
 
             if test_projects:
                 print(f"⚠️  AppleScript cleanup found 0 projects, but Python found {len(test_projects)}. Using Python cleanup...")
-                for project in test_projects:
-                    try:
-                        delete_project_by_id(project["uuid"])
-                    except Exception as e:
-                        print(f"⚠️  Failed to delete project {project.get('title', 'unknown')}: {e}")
+                if not delete_items_by_ids([], [project["uuid"] for project in test_projects]):
+                    for project in test_projects:
+                        try:
+                            delete_project_by_id(project["uuid"])
+                        except Exception as e:
+                            print(f"⚠️  Failed to delete project {project.get('title', 'unknown')}: {e}")
                 print(f"✅ Python cleanup completed for {len(test_projects)} projects")
             else:
                 print("✅ No test projects found via Python")
@@ -433,10 +521,61 @@ def delete_test_projects():
         print("✅ Successfully cleaned up test projects via AppleScript")
 
 
+# Todos, projects, areas and tags are removed in that order in one osascript run;
+# the full script then verifies nothing is left, the sweep-only one skips that scan
+_CLEANUP_SWEEP = f"{_TODO_CLEANUP}{_PROJECT_CLEANUP}{_AREA_CLEANUP}{_TAG_CLEANUP}"
+
+_CLEANUP_ALL_SCRIPT = f"""
+    tell application "Things3"
+        try
+{_CLEANUP_SWEEP}{_VERIFY_CLEANUP}
+        on error errMsg
+            return "Error: " & errMsg
+        end try
+    end tell
+    """
+
+_CLEANUP_SWEEP_SCRIPT = f"""
+    tell application "Things3"
+        try
+{_CLEANUP_SWEEP}
+            return "success"
+        on error errMsg
+            return "Error: " & errMsg
+        end try
+    end tell
+    """
+
+
+def cleanup_all_test_artifacts(verify: bool = True) -> bool:
+    """Delete (and optionally verify) all namespaced test data in a single AppleScript run.
+
+    Falls back to the individual cleanup helpers if anything is left over.
+
+    Args:
+        verify: Whether to also scan Things for leftover test items afterwards.
+
+    Returns:
+        True if the cleanup succeeded (and, when verifying, no test items remain).
+    """
+    result = run_applescript(_CLEANUP_ALL_SCRIPT if verify else _CLEANUP_SWEEP_SCRIPT, timeout=30)
+    if result == "success":
+        print("✅ Cleaned up and verified all test items" if verify else "✅ Cleaned up all test items")
+        return True
+
+    print(f"⚠️  Batched cleanup result: {result}")
+    delete_test_todos()
+    delete_test_projects()
+    delete_test_areas()
+    delete_test_tags()
+    return verify_cleanup() if verify else False
+
+
 class CleanupTracker:
     """Enhanced helper class to track and clean up test items, tags, and areas"""
 
-    def __init__(self: "CleanupTracker") -> None:
+    def __init__(self: "CleanupTracker", verify: bool = True) -> None:
+        self.verify = verify
         self.test_todos: list[str] = []
         self.test_projects: list[str] = []
         self.test_areas: list[str] = []
@@ -464,66 +603,72 @@ class CleanupTracker:
 
     def cleanup(self: "CleanupTracker") -> None:
         """Clean up all test items, tags, and areas"""
-        # Clean up todos first
-        for todo_id in self.test_todos:
-            try:
-                delete_todo_by_id(todo_id)
-            except (RuntimeError, ValueError, OSError) as e:
-                print(f"Failed to clean up todo {todo_id}: {e}")
-
-        # Then clean up projects
-        for project_id in self.test_projects:
-            try:
-                delete_project_by_id(project_id)
-            except (RuntimeError, ValueError, OSError) as e:
-                print(f"Failed to clean up project {project_id}: {e}")
-
-        # Clean up all test tags and areas (these are cleaned up globally)
-        delete_test_todos()  # Catch any remaining todos
-        delete_test_projects()  # Catch any remaining projects
-        delete_test_areas()  # Clean up areas after todos/projects
-        delete_test_tags()  # Clean up tags last
-        verify_cleanup()  # Verify everything was cleaned up
-
-
-@pytest.fixture(scope="session", autouse=True)
+        # Clean up tracked todos and projects in one AppleScript run,
+        # falling back to one call per item if the batch script fails
+        if not delete_items_by_ids(self.test_todos, self.test_projects):
+            for todo_id in self.test_todos:
+                try:
+                    delete_todo_by_id(todo_id)
+                except (RuntimeError, ValueError, OSError) as e:
+                    print(f"Failed to clean up todo {todo_id}: {e}")
+
+            for project_id in self.test_projects:
+                try:
+                    delete_project_by_id(project_id)
+                except (RuntimeError, ValueError, OSError) as e:
+                    print(f"Failed to clean up project {project_id}: {e}")
+
+        # Catch any remaining test items, then areas and tags (these are cleaned up globally)
+        cleanup_all_test_artifacts(verify=self.verify)
+
+
+@pytest.fixture(scope="session")
 def _setup_test_environment():
-    """Set up test environment and clean up after all tests."""
-    # Ensure Things is ready
-    assert ensure_things_ready(), "Things app is not ready for testing"
+    """Set up the Things test environment and clean up after all tests."""
+    # Probe Things once per worker; this also sends Things its first Apple event of the session.
+    # Skipping here is cached for the session, so tests don't each wait out an AppleScript timeout.
+    if not ensure_things_ready():
+        pytest.skip("Things is not running or not responding; skipping tests that need it")
+
+    # Open this worker's things.py database handle once, before the first test reads from it
+    things_db()
 
     # Clean up any existing test data before starting
-    delete_test_todos()  # Clean up todos first
-    delete_test_projects()  # Then projects
-    delete_test_areas()  # Then areas
-    delete_test_tags()  # Then tags
-    verify_cleanup()  # Verify initial cleanup
+    cleanup_all_test_artifacts()
 
     yield
 
     # Clean up all test data after all tests complete
-    delete_test_todos()  # Clean up todos first
-    delete_test_projects()  # Then projects
-    delete_test_areas()  # Then areas
-    delete_test_tags()  # Then tags
-    verify_cleanup()  # Verify final cleanup
+    cleanup_all_test_artifacts()
+
+
+@pytest.fixture(autouse=True)
+def _require_things(request):
+    """Set up the Things session for every test except those marked ``unit``, which run offline."""
+    if request.node.get_closest_marker("unit") is None:
+        request.getfixturevalue("_setup_test_environment")
+
+
+@pytest.fixture(scope="module")
+def module_cleanup_tracker(request):
+    """Fixture to track items for a whole test module and clean them up in one batch at the end"""
+    tracker = CleanupTracker(verify=request.config.getoption("--verify-cleanup"))
+    yield tracker
+    tracker.cleanup()
 
 
 @pytest.fixture()
-def cleanup_tracker():
+def cleanup_tracker(request):
     """Fixture to provide cleanup tracking"""
-    tracker = CleanupTracker()
+    # The whole-database leftover scan runs once per session unless --verify-cleanup is given
+    tracker = CleanupTracker(verify=request.config.getoption("--verify-cleanup"))
     yield tracker
     tracker.cleanup()
-    verify_cleanup()  # Verify cleanup after each test
 
 
 def extract_tag_names(tags_data):
     """Helper function to extract tag names from Things API response"""
-    tag_names = []
-    for tag in tags_data:
-        if isinstance(tag, dict):
-            tag_names.append(tag.get("title", ""))
-        else:
-            tag_names.append(str(tag))
-    return tag_names
+    # things.py returns either all tag dicts or all tag names, so check the first entry only
+    if tags_data and isinstance(tags_data[0], dict):
+        return [tag.get("title", "") for tag in tags_data]
+    return [str(tag) for tag in tags_data]
@@ -12,17 +12,14 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 import things  # noqa: E402
 
-from tests.conftest import (  # noqa: E402
-    delete_project_by_id,
-    delete_todo_by_id,
-    generate_random_string,
-)
+from tests.conftest import get_items_by_ids  # noqa: E402
 from things3_mcp.applescript_bridge import (  # noqa: E402
     add_project,
     add_todo,
     update_project,
     update_todo,
 )
+from things3_mcp.database import things_db  # noqa: E402
 
 
 def get_item_safely(item_id: str, expected_status: str = None) -> dict:
@@ -36,33 +33,24 @@ def get_item_safely(item_id: str, expected_status: str = None) -> dict:
         The item dict if found, None otherwise
     """
     # First try the direct approach
-    item = things.get(item_id)
+    item = things.get(item_id, database=things_db())
     if item:
         return item
 
-    # If not found and we have an expected status, try searching by status
-    if expected_status:
-        if expected_status in ["completed", "canceled"]:
-            # Search in todos with the specific status
-            items = things.todos(status=expected_status)
-            for found_item in items:
-                if found_item.get("uuid") == item_id:
-                    return found_item
-
-            # Also try projects if it might be a project
-            projects = things.projects()
-            for found_project in projects:
-                if found_project.get("uuid") == item_id:
-                    return found_project
+    # If not found and we have an expected status, look the row up by uuid directly
+    # rather than scanning every todo and project with that status
+    if expected_status in ["completed", "canceled"]:
+        return get_items_by_ids(item_id).get(item_id)
 
     return None
 
 
-def test_mark_todo_as_completed(test_namespace):
+def test_mark_todo_as_completed(test_namespace, uid, module_cleanup_tracker):
     """Test marking a todo as completed."""
     # Create a todo
-    title = f"{test_namespace} Todo to Complete {generate_random_string(5)}"
+    title = f"{test_namespace} Todo to Complete {uid}"
     todo_id = add_todo(title=title)
+    module_cleanup_tracker.add_todo(todo_id)
     assert todo_id, "Failed to create todo"
 
     # Mark as completed
@@ -74,15 +62,13 @@ def test_mark_todo_as_completed(test_namespace):
     assert todo, "Failed to retrieve todo"
     assert todo.get("status") == "completed", f"Todo status should be 'completed', got {todo.get('status')}"
 
-    # Clean up
-    delete_todo_by_id(todo_id)
-
 
-def test_mark_project_as_completed(test_namespace):
+def test_mark_project_as_completed(test_namespace, uid, module_cleanup_tracker):
     """Test marking a project as completed."""
     # Create a project
-    title = f"{test_namespace} Project to Complete {generate_random_string(5)}"
+    title = f"{test_namespace} Project to Complete {uid}"
     project_id = add_project(title=title)
+    module_cleanup_tracker.add_project(project_id)
     assert project_id, "Failed to create project"
 
     # Mark as completed
@@ -94,15 +80,13 @@ def test_mark_project_as_completed(test_namespace):
     assert project, "Failed to retrieve project"
     assert project.get("status") == "completed", f"Project status should be 'completed', got {project.get('status')}"
 
-    # Clean up
-    delete_project_by_id(project_id)
-
 
-def test_mark_todo_as_canceled(test_namespace):
+def test_mark_todo_as_canceled(test_namespace, uid, module_cleanup_tracker):
     """Test marking a todo as canceled."""
     # Create a todo
-    title = f"{test_namespace} Todo to Cancel {generate_random_string(5)}"
+    title = f"{test_namespace} Todo to Cancel {uid}"
     todo_id = add_todo(title=title)
+    module_cleanup_tracker.add_todo(todo_id)
     assert todo_id, "Failed to create todo"
 
     # Mark as canceled
@@ -114,15 +98,13 @@ def test_mark_todo_as_canceled(test_namespace):
     assert todo, "Failed to retrieve todo"
     assert todo.get("status") == "canceled", f"Todo status should be 'canceled', got {todo.get('status')}"
 
-    # Clean up
-    delete_todo_by_id(todo_id)
 
-
-def test_mark_project_as_canceled(test_namespace):
+def test_mark_project_as_canceled(test_namespace, uid, module_cleanup_tracker):
     """Test marking a project as canceled."""
     # Create a project
-    title = f"{test_namespace} Project to Cancel {generate_random_string(5)}"
+    title = f"{test_namespace} Project to Cancel {uid}"
     project_id = add_project(title=title)
+    module_cleanup_tracker.add_project(project_id)
     assert project_id, "Failed to create project"
 
     # Mark as canceled
@@ -134,19 +116,17 @@ def test_mark_project_as_canceled(test_namespace):
     assert project, "Failed to retrieve project"
     assert project.get("status") == "canceled", f"Project status should be 'canceled', got {project.get('status')}"
 
-    # Clean up
-    delete_project_by_id(project_id)
-
 
-def test_completion_with_other_updates(test_namespace):
+def test_completion_with_other_updates(test_namespace, uid, module_cleanup_tracker):
     """Test marking items as completed while also updating other properties."""
     # Create a todo
-    title = f"{test_namespace} Todo for Multi-Update {generate_random_string(5)}"
+    title = f"{test_namespace} Todo for Multi-Update {uid}"
     todo_id = add_todo(title=title)
+    module_cleanup_tracker.add_todo(todo_id)
     assert todo_id, "Failed to create todo"
 
     # Mark as completed while updating other properties
-    new_title = f"{test_namespace} Updated and Completed Todo {generate_random_string(5)}"
+    new_title = f"{test_namespace} Updated and Completed Todo {uid}"
     result = update_todo(
         id=todo_id,
         title=new_title,
@@ -162,70 +142,61 @@ def test_completion_with_other_updates(test_namespace):
     assert todo.get("title") == new_title, "Todo title should be updated"
     assert todo.get("notes") == "Updated notes and completed", "Todo notes should be updated"
 
-    # Clean up
-    delete_todo_by_id(todo_id)
 
-
-def test_completion_edge_cases(test_namespace):
+def test_completion_edge_cases(test_namespace, uid, module_cleanup_tracker):
     """Test completion edge cases and validation."""
     # Test completing a todo that's already completed
-    title = f"{test_namespace} Already Completed Todo {generate_random_string(5)}"
+    title = f"{test_namespace} Already Completed Todo {uid}"
     todo_id = add_todo(title=title)
+    module_cleanup_tracker.add_todo(todo_id)
     assert todo_id, "Failed to create todo"
 
-    try:
-        # Mark as completed first time
-        result = update_todo(id=todo_id, completed=True)
-        assert result, "Failed to mark todo as completed"
+    # Mark as completed first time
+    result = update_todo(id=todo_id, completed=True)
+    assert result, "Failed to mark todo as completed"
 
-        # Try to complete again (should still work)
-        result = update_todo(id=todo_id, completed=True)
-        assert result, "Failed to mark already completed todo as completed again"
+    # Try to complete again (should still work)
+    result = update_todo(id=todo_id, completed=True)
+    assert result, "Failed to mark already completed todo as completed again"
 
-        # Verify still completed - use the helper function to safely retrieve completed items
-        todo = get_item_safely(todo_id, "completed")
-        assert todo, f"Completed todo with ID {todo_id} not found"
-        assert todo.get("status") == "completed", "Todo should still be completed"
-    finally:
-        # Clean up
-        delete_todo_by_id(todo_id)
+    # Verify still completed - use the helper function to safely retrieve completed items
+    todo = get_item_safely(todo_id, "completed")
+    assert todo, f"Completed todo with ID {todo_id} not found"
+    assert todo.get("status") == "completed", "Todo should still be completed"
 
 
-def test_completion_status_verification(test_namespace):
+def test_completion_status_verification(test_namespace, uid, module_cleanup_tracker):
     """Test comprehensive verification of completion status."""
     # Create both a todo and project
-    todo_title = f"{test_namespace} Status Test Todo {generate_random_string(5)}"
-    project_title = f"{test_namespace} Status Test Project {generate_random_string(5)}"
+    todo_title = f"{test_namespace} Status Test Todo {uid}"
+    project_title = f"{test_namespace} Status Test Project {uid}"
 
     todo_id = add_todo(title=todo_title)
+    module_cleanup_tracker.add_todo(todo_id)
     project_id = add_project(title=project_title)
+    module_cleanup_tracker.add_project(project_id)
     assert todo_id, "Failed to create todo"
     assert project_id, "Failed to create project"
 
-    try:
-        # Verify initial status is incomplete
-        todo = get_item_safely(todo_id, "incomplete")
-        project = get_item_safely(project_id, "incomplete")
-        assert todo.get("status") == "incomplete", "New todo should be incomplete"
-        assert project.get("status") == "incomplete", "New project should be incomplete"
-
-        # Mark todo as completed
-        result = update_todo(id=todo_id, completed=True)
-        assert result, "Failed to mark todo as completed"
-
-        # Mark project as canceled
-        result = update_project(id=project_id, canceled=True)
-        assert result, "Failed to mark project as canceled"
-
-        # Verify final statuses
-        todo = get_item_safely(todo_id, "completed")
-        project = get_item_safely(project_id, "canceled")
-        assert todo.get("status") == "completed", "Todo should be completed"
-        assert project.get("status") == "canceled", "Project should be canceled"
-    finally:
-        # Clean up
-        delete_todo_by_id(todo_id)
-        delete_project_by_id(project_id)
+    # Verify initial status is incomplete (one query for both items)
+    items = get_items_by_ids(todo_id, project_id)
+    todo, project = items.get(todo_id, {}), items.get(project_id, {})
+    assert todo.get("status") == "incomplete", "New todo should be incomplete"
+    assert project.get("status") == "incomplete", "New project should be incomplete"
+
+    # Mark todo as completed
+    result = update_todo(id=todo_id, completed=True)
+    assert result, "Failed to mark todo as completed"
+
+    # Mark project as canceled
+    result = update_project(id=project_id, canceled=True)
+    assert result, "Failed to mark project as canceled"
+
+    # Verify final statuses
+    items = get_items_by_ids(todo_id, project_id)
+    todo, project = items.get(todo_id, {}), items.get(project_id, {})
+    assert todo.get("status") == "completed", "Todo should be completed"
+    assert project.get("status") == "canceled", "Project should be canceled"
 
 
 def test_invalid_completion_operations(test_namespace):
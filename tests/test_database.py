@@ -0,0 +1,72 @@
+"""Test suite for the per-thread things.py database handles."""
+
+import os
+import sqlite3
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from things3_mcp import database, fast_server
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def db_file(tmp_path, monkeypatch):
+    """Point things_db() at a fake Database for a file in tmp_path, with no handles open yet."""
+    path = tmp_path / "main.sqlite"
+    path.write_bytes(b"")
+    monkeypatch.setattr(database, "_local", threading.local())
+    with patch.object(database, "Database", side_effect=lambda: MagicMock(filepath=str(path))) as mock_database:
+        yield path, mock_database
+
+
+def test_things_db_reuses_the_handle_within_a_thread(db_file):
+    """Test that repeated calls on one thread share a single handle."""
+    _, mock_database = db_file
+
+    assert database.things_db() is database.things_db()
+    assert mock_database.call_count == 1
+
+
+def test_things_db_opens_a_handle_per_thread(db_file):
+    """Test that each thread gets its own handle."""
+    handles = []
+    thread = threading.Thread(target=lambda: handles.append(database.things_db()))
+    thread.start()
+    thread.join()
+
+    assert handles[0] is not database.things_db()
+
+
+def test_things_db_reopens_after_the_file_is_replaced(db_file, tmp_path):
+    """Test that a handle is closed and re-opened once Things replaces the database file."""
+    path, _ = db_file
+    old_handle = database.things_db()
+
+    replacement = tmp_path / "main.sqlite.new"
+    replacement.write_bytes(b"")
+    os.replace(replacement, path)
+    new_handle = database.things_db()
+
+    assert new_handle is not old_handle
+    old_handle.connection.close.assert_called_once()
+
+
+def test_db_errors_are_retried_on_a_new_handle(db_file):
+    """Test that a sqlite3.DatabaseError drops the handle before the read is retried."""
+    handles = []
+
+    @fast_server.retry_on_db_error
+    def read():
+        handles.append(database.things_db())
+        if len(handles) == 1:
+            raise sqlite3.DatabaseError("database disk image is malformed")
+        return "ok"
+
+    with patch.object(fast_server.time, "sleep"):
+        assert read() == "ok"
+
+    assert handles[0] is not handles[1]
+    handles[0].connection.close.assert_called_once()
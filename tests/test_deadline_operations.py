@@ -6,149 +6,140 @@ updates, validation, and edge cases.
 
 import os
 import sys
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 
 # Add the src directory to the path so we can import our modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+import pytest  # noqa: E402
 import things  # noqa: E402
 
-from tests.conftest import (  # noqa: E402
-    delete_project_by_id,
-    delete_todo_by_id,
-    generate_random_string,
-)
 from things3_mcp.applescript_bridge import (  # noqa: E402
     add_project,
     add_todo,
     update_project,
     update_todo,
 )
+from things3_mcp.database import things_db  # noqa: E402
+
+# Deadlines relative to today, computed once so a test can't straddle midnight
+_TODAY = date.today()
+_DEADLINES = {days: (_TODAY + timedelta(days=days)).isoformat() for days in (-1, 0, 1, 7, 14, 21, 365)}
 
 
-def test_add_todo_with_deadline(test_namespace):
+def test_add_todo_with_deadline(test_namespace, uid, module_cleanup_tracker):
     """Test adding a todo with a deadline."""
     # Test with tomorrow's date
-    tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
-    title = f"{test_namespace} Todo with Deadline {generate_random_string(5)}"
+    tomorrow = _DEADLINES[1]
+    title = f"{test_namespace} Todo with Deadline {uid}"
 
     todo_id = add_todo(title=title, deadline=tomorrow)
+
+    module_cleanup_tracker.add_todo(todo_id)
     assert todo_id, "Failed to create todo with deadline"
 
     # Verify the deadline was set by retrieving the todo
-    todo = things.get(todo_id)
+    todo = things.get(todo_id, database=things_db())
     assert todo, "Failed to retrieve created todo"
     assert todo.get("deadline"), "Deadline was not set on todo"
     assert todo["deadline"] == tomorrow, f"Deadline mismatch: expected {tomorrow}, got {todo['deadline']}"
 
-    # Clean up
-    delete_todo_by_id(todo_id)
-
 
-def test_update_todo_deadline(test_namespace):
+def test_update_todo_deadline(test_namespace, uid, module_cleanup_tracker):
     """Test updating a todo's deadline."""
     # Create a todo without deadline
-    title = f"{test_namespace} Todo for Deadline Update {generate_random_string(5)}"
+    title = f"{test_namespace} Todo for Deadline Update {uid}"
     todo_id = add_todo(title=title)
+    module_cleanup_tracker.add_todo(todo_id)
     assert todo_id, "Failed to create todo"
 
     # Update with a deadline
-    new_deadline = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+    new_deadline = _DEADLINES[7]
     result = update_todo(id=todo_id, deadline=new_deadline)
     assert result, "Failed to update todo deadline"
 
     # Verify the deadline was updated
-    todo = things.get(todo_id)
+    todo = things.get(todo_id, database=things_db())
     assert todo.get("deadline"), "Deadline was not set on todo"
     assert todo["deadline"] == new_deadline, f"Deadline mismatch: expected {new_deadline}, got {todo['deadline']}"
 
-    # Clean up
-    delete_todo_by_id(todo_id)
 
-
-def test_add_project_with_deadline(test_namespace):
+def test_add_project_with_deadline(test_namespace, uid, module_cleanup_tracker):
     """Test adding a project with a deadline."""
     # Test with a future date
-    future_date = (datetime.now() + timedelta(days=14)).strftime("%Y-%m-%d")
-    title = f"{test_namespace} Project with Deadline {generate_random_string(5)}"
+    future_date = _DEADLINES[14]
+    title = f"{test_namespace} Project with Deadline {uid}"
 
     project_id = add_project(title=title, deadline=future_date)
+
+    module_cleanup_tracker.add_project(project_id)
     assert project_id, "Failed to create project with deadline"
 
     # Verify the deadline was set
-    project = things.get(project_id)
+    project = things.get(project_id, database=things_db())
     assert project, "Failed to retrieve created project"
     assert project.get("deadline"), "Deadline was not set on project"
     assert project["deadline"] == future_date, f"Deadline mismatch: expected {future_date}, got {project['deadline']}"
 
-    # Clean up
-    delete_project_by_id(project_id)
 
-
-def test_update_project_deadline(test_namespace):
+def test_update_project_deadline(test_namespace, uid, module_cleanup_tracker):
     """Test updating a project's deadline."""
     # Create a project without deadline
-    title = f"{test_namespace} Project for Deadline Update {generate_random_string(5)}"
+    title = f"{test_namespace} Project for Deadline Update {uid}"
     project_id = add_project(title=title)
+    module_cleanup_tracker.add_project(project_id)
     assert project_id, "Failed to create project"
 
     # Update with a deadline
-    new_deadline = (datetime.now() + timedelta(days=21)).strftime("%Y-%m-%d")
+    new_deadline = _DEADLINES[21]
     result = update_project(id=project_id, deadline=new_deadline)
     assert result, "Failed to update project deadline"
 
     # Verify the deadline was updated
-    project = things.get(project_id)
+    project = things.get(project_id, database=things_db())
     assert project.get("deadline"), "Deadline was not set on project"
     assert project["deadline"] == new_deadline, f"Deadline mismatch: expected {new_deadline}, got {project['deadline']}"
 
-    # Clean up
-    delete_project_by_id(project_id)
-
 
-def test_deadline_edge_cases(test_namespace):
+@pytest.mark.parametrize(
+    ("label", "days"),
+    [
+        ("Today", 0),
+        ("Yesterday", -1),  # Past dates should still work, Things allows this
+        ("Far Future", 365),
+    ],
+)
+def test_deadline_edge_cases(test_namespace, uid, module_cleanup_tracker, label, days):
     """Test deadline edge cases and validation."""
-    title = f"{test_namespace} Deadline Edge Cases {generate_random_string(5)}"
-
-    # Test with today's date
-    today = datetime.now().strftime("%Y-%m-%d")
-    todo_id = add_todo(title=f"{title} - Today", deadline=today)
-    assert todo_id, "Failed to create todo with today's deadline"
-    delete_todo_by_id(todo_id)
+    title = f"{test_namespace} Deadline Edge Cases {uid}"
 
-    # Test with past date (should still work, Things allows this)
-    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
-    todo_id = add_todo(title=f"{title} - Yesterday", deadline=yesterday)
-    assert todo_id, "Failed to create todo with past deadline"
-    delete_todo_by_id(todo_id)
+    todo_id = add_todo(title=f"{title} - {label}", deadline=_DEADLINES[days])
 
-    # Test with far future date
-    far_future = (datetime.now() + timedelta(days=365)).strftime("%Y-%m-%d")
-    todo_id = add_todo(title=f"{title} - Far Future", deadline=far_future)
-    assert todo_id, "Failed to create todo with far future deadline"
-    delete_todo_by_id(todo_id)
+    module_cleanup_tracker.add_todo(todo_id)
+    assert todo_id, f"Failed to create todo with {label.lower()} deadline"
 
 
-def test_invalid_deadline_format(test_namespace):
-    """Test handling of invalid deadline formats."""
-    title = f"{test_namespace} Invalid Deadline {generate_random_string(5)}"
-
-    # Test with invalid date formats
-    invalid_deadlines = [
+@pytest.mark.parametrize(
+    "invalid_deadline",
+    [
         "2024/01/01",  # Wrong separator
         "01-01-2024",  # Wrong order
         "2024-13-01",  # Invalid month
         "2024-01-32",  # Invalid day
         "not-a-date",  # Completely invalid
         "",  # Empty string
-    ]
-
-    for invalid_deadline in invalid_deadlines:
-        todo_id = add_todo(title=f"{title} - {invalid_deadline}", deadline=invalid_deadline)
-        # We expect this to either fail gracefully or create without deadline
-        if todo_id:
-            todo = things.get(todo_id)
-            # If it was created, it should not have a deadline set
-            if todo and "deadline" in todo:
-                assert not todo["deadline"], f"Invalid deadline '{invalid_deadline}' was incorrectly set"
-            delete_todo_by_id(todo_id)
+    ],
+)
+def test_invalid_deadline_format(test_namespace, uid, module_cleanup_tracker, invalid_deadline):
+    """Test handling of invalid deadline formats."""
+    title = f"{test_namespace} Invalid Deadline {uid}"
+
+    todo_id = add_todo(title=f"{title} - {invalid_deadline}", deadline=invalid_deadline)
+
+    module_cleanup_tracker.add_todo(todo_id)
+    # We expect this to either fail gracefully or create without deadline
+    if todo_id:
+        todo = things.get(todo_id, database=things_db())
+        # If it was created, it should not have a deadline set
+        if todo and "deadline" in todo:
+            assert not todo["deadline"], f"Invalid deadline '{invalid_deadline}' was incorrectly set"
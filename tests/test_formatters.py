@@ -0,0 +1,31 @@
+"""Test suite for the todo and project formatters."""
+
+from unittest.mock import patch
+
+import pytest
+
+from things3_mcp import formatters
+
+pytestmark = pytest.mark.unit
+
+
+def test_format_todo_uses_parent_titles_from_the_row():
+    """Test that project and area titles come from the row without extra lookups."""
+    todo = {"uuid": "abc", "title": "First", "type": "to-do", "project": "p1", "project_title": "Renamed Project", "area": "a1", "area_title": "Home"}
+
+    with patch.object(formatters.things, "get", side_effect=AssertionError("should not look up parents")):
+        todo_text = formatters.format_todo(todo)
+
+    assert "Project: Renamed Project" in todo_text
+    assert "Area: Home" in todo_text
+
+
+def test_format_todo_looks_up_missing_parent_titles():
+    """Test that a parent title missing from the row is looked up by UUID."""
+    todo = {"uuid": "abc", "title": "First", "type": "to-do", "project": "p1"}
+
+    with patch.object(formatters, "things_db"), patch.object(formatters.things, "get", return_value={"title": "Looked Up"}) as mock_get:
+        todo_text = formatters.format_todo(todo)
+
+    assert "Project: Looked Up" in todo_text
+    assert mock_get.call_args.args == ("p1",)
@@ -13,37 +13,41 @@ import things  # noqa: E402
 from things3_mcp.applescript_bridge import (  # noqa: E402
     add_project,
     add_todo,
+    add_todos,
     update_project,
     update_todo,
 )
+from things3_mcp.database import things_db  # noqa: E402
+
+from .conftest import extract_tag_names  # noqa: E402
+
+_INITIAL_TAGS = ("integration", "test")
+_NEW_PROJECT_TAGS = ("integration", "test", "updated", "boost")
+_NEW_TODO_TAGS = ("integration", "test", "updated", "priority")
+# Ordered de-duplication keeps tag creation order stable between runs
+_ALL_TAGS = tuple(dict.fromkeys(_INITIAL_TAGS + _NEW_PROJECT_TAGS + _NEW_TODO_TAGS))
 
 
 def test_integration_workflow(cleanup_tracker, test_namespace):
     """Test a complete workflow: create, update, and verify consistency"""
-    # Create test tags first
-    initial_tags = ["integration", "test"]
-    new_project_tags = ["integration", "test", "updated", "boost"]
-    new_todo_tags = ["integration", "test", "updated", "priority"]
+    # Namespaced tag names, formatted once per tag
+    ns = {tag: f"{test_namespace}-{tag}" for tag in _ALL_TAGS}
 
-    all_tags = list(set(initial_tags + new_project_tags + new_todo_tags))
-    for tag in all_tags:
-        result = add_todo(title=f"{test_namespace}-{tag}")
+    # Create test tags first
+    tag_todo_ids = add_todos([{"title": ns[tag]} for tag in _ALL_TAGS])
+    for tag, result in zip(_ALL_TAGS, tag_todo_ids, strict=True):
         if result:
             cleanup_tracker.add_todo(result)  # Track the todo for cleanup
             cleanup_tracker.add_tag(tag)  # Also track the tag
 
     # 1. Create a project and todos
     project_title = f"{test_namespace} Integration Test Project 🔄"
-    project_id = add_project(title=project_title, notes="Initial project notes", tags=[f"{test_namespace}-{tag}" for tag in initial_tags])
+    project_id = add_project(title=project_title, notes="Initial project notes", tags=[ns[tag] for tag in _INITIAL_TAGS])
     cleanup_tracker.add_project(project_id)
 
-    # Create todos and add them to the project
+    # Create todos and add them to the project (list_title adds them to the project)
     todo_titles = [f"{test_namespace} Setup task", f"{test_namespace} Development task", f"{test_namespace} Testing task"]
-    for todo_title in todo_titles:
-        todo_id = add_todo(
-            title=todo_title,
-            list_title=project_title,  # This will add it to the project
-        )
+    for todo_id in add_todos([{"title": todo_title, "list_title": project_title} for todo_title in todo_titles]):
         if todo_id:
             cleanup_tracker.add_todo(todo_id)
 
@@ -51,42 +55,33 @@ def test_integration_workflow(cleanup_tracker, test_namespace):
 
     # 2. Create a standalone todo
     todo_title = f"{test_namespace} Integration Test Todo 📋"
-    todo_id = add_todo(title=todo_title, notes="Initial todo notes", tags=[f"{test_namespace}-{tag}" for tag in initial_tags])
+    todo_id = add_todo(title=todo_title, notes="Initial todo notes", tags=[ns[tag] for tag in _INITIAL_TAGS])
     cleanup_tracker.add_todo(todo_id)
 
     assert todo_id is not False, "Todo creation should succeed"
 
     # 3. Update both with new information
-    project_success = update_project(id=project_id, notes="Updated project notes with more details ✨", tags=[f"{test_namespace}-{tag}" for tag in new_project_tags])
+    project_success = update_project(id=project_id, notes="Updated project notes with more details ✨", tags=[ns[tag] for tag in _NEW_PROJECT_TAGS])
 
-    todo_success = update_todo(id=todo_id, notes="Updated todo notes with more details 🎯", tags=[f"{test_namespace}-{tag}" for tag in new_todo_tags])
+    todo_success = update_todo(id=todo_id, notes="Updated todo notes with more details 🎯", tags=[ns[tag] for tag in _NEW_TODO_TAGS])
 
     assert project_success == "true", "Project update should succeed"
     assert todo_success == "true", "Todo update should succeed"
 
     # 4. Verify final state
-    project = things.get(project_id)
-    todo = things.get(todo_id)
+    project = things.get(project_id, database=things_db())
+    todo = things.get(todo_id, database=things_db())
 
     # Extract tag names from response
-    def extract_tag_names(tags_data):
-        tag_names = []
-        for tag in tags_data:
-            if isinstance(tag, dict):
-                tag_names.append(tag.get("title", ""))
-            else:
-                tag_names.append(str(tag))
-        return tag_names
-
     project_tag_titles = extract_tag_names(project.get("tags", []))
     todo_tag_titles = extract_tag_names(todo.get("tags", []))
 
-    for tag in new_project_tags:
-        expected_tag = f"{test_namespace}-{tag}"
+    for tag in _NEW_PROJECT_TAGS:
+        expected_tag = ns[tag]
         assert expected_tag in project_tag_titles, f"Project should have tag '{expected_tag}'"
 
-    for tag in new_todo_tags:
-        expected_tag = f"{test_namespace}-{tag}"
+    for tag in _NEW_TODO_TAGS:
+        expected_tag = ns[tag]
         assert expected_tag in todo_tag_titles, f"Todo should have tag '{expected_tag}'"
 
     assert "Updated project notes" in project["notes"], "Project notes should be updated"
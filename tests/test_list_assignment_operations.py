@@ -6,6 +6,7 @@ parameters for add_todo, update_todo, add_project, and update_project operations
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the src directory to the path so we can import our modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -18,13 +19,14 @@ from things3_mcp.applescript_bridge import (  # noqa: E402
     update_project,
     update_todo,
 )
+from things3_mcp.database import things_db  # noqa: E402
 
 from .conftest import (  # noqa: E402
     create_test_area,
     delete_project_by_id,
     delete_todo_by_id,
     generate_random_string,
-    rename_test_area,
+    get_items_by_ids,
 )
 
 # ============================================================================
@@ -45,7 +47,7 @@ def test_update_todo_to_inbox(test_namespace):
         assert "true" in str(result).lower(), f"Failed to move todo to Inbox: {result}"
 
         # Verify the todo is now in Inbox
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         # Inbox todos don't have a specific list property, but we can verify it's not in other lists
         assert not todo.get("start_date"), "Todo should not have a start date in Inbox"
         assert not todo.get("deadline"), "Todo should not have a deadline in Inbox"
@@ -66,7 +68,7 @@ def test_update_todo_to_today(test_namespace):
         assert "true" in str(result).lower(), f"Failed to move todo to Today: {result}"
 
         # Verify the todo is now in Today
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         # Today todos should have today's date as start_date
         from datetime import datetime
 
@@ -89,7 +91,7 @@ def test_update_todo_to_anytime(test_namespace):
         assert "true" in str(result).lower(), f"Failed to move todo to Anytime: {result}"
 
         # Verify the todo is now in Anytime
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         # Anytime todos should not have a start_date
         assert not todo.get("start_date"), "Todo should not have a start date in Anytime"
     finally:
@@ -109,7 +111,7 @@ def test_update_todo_to_someday(test_namespace):
         assert "true" in str(result).lower(), f"Failed to move todo to Someday: {result}"
 
         # Verify the todo is now in Someday
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         # Someday todos should not have a start_date
         assert not todo.get("start_date"), "Todo should not have a start date in Someday"
     finally:
@@ -141,7 +143,7 @@ def test_move_todo_between_builtin_lists(test_namespace):
         assert "true" in str(result).lower(), "Failed to move todo to Anytime"
 
         # Verify final state
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         assert not todo.get("start_date"), "Todo should be in Anytime (no start date)"
     finally:
         delete_todo_by_id(todo_id)
@@ -155,14 +157,9 @@ def test_move_todo_between_builtin_lists(test_namespace):
 def test_add_todo_to_area_via_list_id(test_namespace):
     """Test adding a todo directly to an area using list_id parameter."""
     # Create test area
-    unique_area_name = f"area-{generate_random_string(8)}"
-    area_id = create_test_area(unique_area_name)
+    area_id = create_test_area(f"DIY-ID-{generate_random_string(5)}")
     assert area_id, "Failed to create test area"
 
-    # Rename area for testing
-    unique_area_title = f"{test_namespace}-DIY-ID-{generate_random_string(5)}"
-    rename_test_area(area_id, unique_area_title)
-
     try:
         # Create todo directly in the area using list_id
         todo_title = f"{test_namespace}-Test Todo in Area by ID {generate_random_string(5)}"
@@ -170,7 +167,7 @@ def test_add_todo_to_area_via_list_id(test_namespace):
         assert todo_id, "Failed to create todo in area using list_id"
 
         # Verify the todo was created in the correct area
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         assert todo["area"] == area_id, f"Todo should be in area {area_id}, but is in {todo.get('area')}"
 
         # Clean up
@@ -194,7 +191,7 @@ def test_add_todo_to_project_via_list_id(test_namespace):
         assert todo_id, "Failed to create todo in project using list_id"
 
         # Verify the todo was created in the correct project
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         assert todo["project"] == project_id, f"Todo should be in project {project_id}, but is in {todo.get('project')}"
 
         # Clean up
@@ -206,14 +203,9 @@ def test_add_todo_to_project_via_list_id(test_namespace):
 def test_update_todo_to_area_via_list_id(test_namespace):
     """Test moving a todo to an area using list_id parameter."""
     # Create test area
-    unique_area_name = f"area-{generate_random_string(8)}"
-    area_id = create_test_area(unique_area_name)
+    area_id = create_test_area(f"Work-ID-{generate_random_string(5)}")
     assert area_id, "Failed to create test area"
 
-    # Rename area for testing
-    unique_area_title = f"{test_namespace}-Work-ID-{generate_random_string(5)}"
-    rename_test_area(area_id, unique_area_title)
-
     # Create a todo in Inbox
     todo_title = f"{test_namespace}-Test Todo Move to Area by ID {generate_random_string(5)}"
     todo_id = add_todo(title=todo_title)
@@ -225,7 +217,7 @@ def test_update_todo_to_area_via_list_id(test_namespace):
         assert "true" in str(result).lower(), f"Failed to move todo to area using list_id: {result}"
 
         # Verify the todo is now in the correct area
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         assert todo["area"] == area_id, f"Todo should be in area {area_id}, but is in {todo.get('area')}"
 
         # Clean up
@@ -253,7 +245,7 @@ def test_update_todo_to_project_via_list_id(test_namespace):
         assert "true" in str(result).lower(), f"Failed to move todo to project using list_id: {result}"
 
         # Verify the todo is now in the correct project
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         assert todo["project"] == project_id, f"Todo should be in project {project_id}, but is in {todo.get('project')}"
 
         # Clean up
@@ -265,14 +257,9 @@ def test_update_todo_to_project_via_list_id(test_namespace):
 def test_add_project_to_area_via_area_id(test_namespace):
     """Test creating a project directly in an area using area_id parameter."""
     # Create test area
-    unique_area_name = f"area-{generate_random_string(8)}"
-    area_id = create_test_area(unique_area_name)
+    area_id = create_test_area(f"Home-ID-{generate_random_string(5)}")
     assert area_id, "Failed to create test area"
 
-    # Rename area for testing
-    unique_area_title = f"{test_namespace}-Home-ID-{generate_random_string(5)}"
-    rename_test_area(area_id, unique_area_title)
-
     try:
         # Create project directly in the area using area_id
         project_title = f"{test_namespace}-Test Project in Area by ID {generate_random_string(5)}"
@@ -280,7 +267,7 @@ def test_add_project_to_area_via_area_id(test_namespace):
         assert project_id, "Failed to create project in area using area_id"
 
         # Verify the project was created in the correct area
-        project = things.get(project_id)
+        project = things.get(project_id, database=things_db())
         assert project["area"] == area_id, f"Project should be in area {area_id}, but is in {project.get('area')}"
 
         # Clean up
@@ -293,14 +280,9 @@ def test_add_project_to_area_via_area_id(test_namespace):
 def test_update_project_to_area_via_area_id(test_namespace):
     """Test moving a project to an area using area_id parameter."""
     # Create test area
-    unique_area_name = f"area-{generate_random_string(8)}"
-    area_id = create_test_area(unique_area_name)
+    area_id = create_test_area(f"Office-ID-{generate_random_string(5)}")
     assert area_id, "Failed to create test area"
 
-    # Rename area for testing
-    unique_area_title = f"{test_namespace}-Office-ID-{generate_random_string(5)}"
-    rename_test_area(area_id, unique_area_title)
-
     # Create a project without area
     project_title = f"{test_namespace}-Test Project Move to Area by ID {generate_random_string(5)}"
     project_id = add_project(title=project_title)
@@ -312,7 +294,7 @@ def test_update_project_to_area_via_area_id(test_namespace):
         assert "true" in str(result).lower(), f"Failed to move project to area using area_id: {result}"
 
         # Verify the project is now in the correct area
-        project = things.get(project_id)
+        project = things.get(project_id, database=things_db())
         assert project["area"] == area_id, f"Project should be in area {area_id}, but is in {project.get('area')}"
 
         # Clean up
@@ -341,7 +323,7 @@ def test_add_todo_to_project_via_list_title(test_namespace):
         assert todo_id, "Failed to create todo in project using list_title"
 
         # Verify the todo was created in the correct project
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         assert todo["project"] == project_id, f"Todo should be in project {project_id}, but is in {todo.get('project')}"
 
         # Clean up
@@ -368,7 +350,7 @@ def test_update_todo_to_project_via_list_title(test_namespace):
         assert "true" in str(result).lower(), f"Failed to move todo to project using list_title: {result}"
 
         # Verify the todo is now in the correct project
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         assert todo["project"] == project_id, f"Todo should be in project {project_id}, but is in {todo.get('project')}"
 
         # Clean up
@@ -419,9 +401,9 @@ def test_list_name_vs_list_id_priority(test_namespace):
     find the area first when searching by name.
     """
     # Create test area and project with same name
-    area_name = f"{test_namespace}-Test Container {generate_random_string(5)}"
-    area_id = create_test_area("temp-area")
-    rename_test_area(area_id, area_name)
+    area_suffix = f"Test Container {generate_random_string(5)}"
+    area_name = f"{test_namespace}-{area_suffix}"
+    area_id = create_test_area(area_suffix)
 
     project_title = area_name  # Same name as area
     project_id = add_project(title=project_title)
@@ -439,7 +421,7 @@ def test_list_name_vs_list_id_priority(test_namespace):
         assert "true" in str(result).lower(), f"Failed to move todo using list_name: {result}"
 
         # Verify it went somewhere (in this case, it goes to the area)
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         # The todo ends up in the area, not the project - this appears to be Things3 behavior
         assert todo.get("area") == area_id, f"Todo should be in area {area_id} when names conflict"
 
@@ -452,7 +434,7 @@ def test_list_name_vs_list_id_priority(test_namespace):
         assert "true" in str(result).lower(), f"Failed to move todo using list_id: {result}"
 
         # Verify it went to the area
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         assert todo["area"] == area_id, f"Todo should be in area {area_id}"
 
         # Clean up
@@ -494,7 +476,7 @@ def test_mcp_server_add_task_with_list_id(test_namespace):
 
         # Verify the todo was created in the correct project
         # This assertion will fail until the MCP server is fixed to pass list_id
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         assert todo.get("project") == project_id, f"Todo should be in project {project_id}, but is in {todo.get('project')} (todo was created in Inbox instead - MCP server is not passing list_id parameter)"
 
         # Clean up
@@ -535,7 +517,7 @@ def test_mcp_server_priority_list_id_over_list_title(test_namespace):
         todo_id = match.group(1)
 
         # Verify the todo was created in project1 (list_id), not project2 (list_title)
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         assert todo.get("project") == project1_id, f"Todo should be in project1 {project1_id} (via list_id), but is in {todo.get('project')}"
 
         # Clean up
@@ -576,7 +558,7 @@ def test_malformed_uuid_handling(test_namespace):
             # Should either gracefully ignore or return error, but not crash
             assert isinstance(result, str), f"Should return string result for malformed UUID: {malformed_uuid}"
             # Todo should remain in its current location (not moved)
-            todo = things.get(todo_id)
+            todo = things.get(todo_id, database=things_db())
             assert todo is not None, f"Todo should still exist after malformed UUID: {malformed_uuid}"
 
     finally:
@@ -607,7 +589,7 @@ def test_empty_list_id_handling(test_namespace):
         assert not result.startswith("/var/folders/"), "Should not return temp file paths"
 
         # Verify todo still exists and is accessible
-        todo = things.get(todo_id)
+        todo = things.get(todo_id, database=things_db())
         assert todo is not None, "Todo should still exist after empty ID tests"
 
     finally:
@@ -640,7 +622,7 @@ def test_valid_looking_but_nonexistent_ids(test_namespace):
                 assert "Error:" in result or "error" in result.lower(), f"Error should be properly formatted: {result}"
 
             # Verify todo still exists and is accessible
-            todo = things.get(todo_id)
+            todo = things.get(todo_id, database=things_db())
             assert todo is not None, f"Todo should still exist after fake UUID: {fake_uuid}"
 
     finally:
@@ -687,9 +669,9 @@ def test_success_message_location_information(test_namespace):
     project_id = add_project(title=project_title)
     assert project_id, "Failed to create test project"
 
-    area_name = f"{test_namespace}-Location Test Area {generate_random_string(5)}"
-    area_id = create_test_area("temp-area")
-    rename_test_area(area_id, area_name)
+    area_suffix = f"Location Test Area {generate_random_string(5)}"
+    area_name = f"{test_namespace}-{area_suffix}"
+    area_id = create_test_area(area_suffix)
 
     created_todos = []
 
@@ -766,9 +748,9 @@ def test_success_message_location_information(test_namespace):
 def test_comprehensive_list_operations(test_namespace):
     """Test all list operations in a comprehensive workflow."""
     # Create test containers
-    area_name = f"{test_namespace}-Test Area {generate_random_string(5)}"
-    area_id = create_test_area("temp-area")
-    rename_test_area(area_id, area_name)
+    area_suffix = f"Test Area {generate_random_string(5)}"
+    area_name = f"{test_namespace}-{area_suffix}"
+    area_id = create_test_area(area_suffix)
 
     project_title = f"{test_namespace}-Test Project {generate_random_string(5)}"
     project_id = add_project(title=project_title)
@@ -785,25 +767,24 @@ def test_comprehensive_list_operations(test_namespace):
         todo2_id = add_todo(title=todo2_title, list_id=project_id)
         assert todo2_id, "Failed to create todo in project by ID"
 
-        # Test 3: Move todo1 to Today
-        result = update_todo(id=todo1_id, list_name="Today")
-        assert "true" in str(result).lower(), "Failed to move todo to Today"
-
-        # Test 4: Move todo2 to Inbox
-        result = update_todo(id=todo2_id, list_name="Inbox")
-        assert "true" in str(result).lower(), "Failed to move todo to Inbox"
-
-        # Test 5: Move todo1 to project by name
-        result = update_todo(id=todo1_id, list_name=project_title)
-        assert "true" in str(result).lower(), "Failed to move todo to project by name"
+        # The two todos are independent, so each pair of moves runs concurrently
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            # Test 3: Move todo1 to Today; Test 4: Move todo2 to Inbox
+            move1 = pool.submit(update_todo, id=todo1_id, list_name="Today")
+            move2 = pool.submit(update_todo, id=todo2_id, list_name="Inbox")
+            assert "true" in str(move1.result()).lower(), "Failed to move todo to Today"
+            assert "true" in str(move2.result()).lower(), "Failed to move todo to Inbox"
 
-        # Test 6: Move todo2 to area by ID
-        result = update_todo(id=todo2_id, list_id=area_id)
-        assert "true" in str(result).lower(), "Failed to move todo to area by ID"
+            # Test 5: Move todo1 to project by name; Test 6: Move todo2 to area by ID
+            move1 = pool.submit(update_todo, id=todo1_id, list_name=project_title)
+            move2 = pool.submit(update_todo, id=todo2_id, list_id=area_id)
+            assert "true" in str(move1.result()).lower(), "Failed to move todo to project by name"
+            assert "true" in str(move2.result()).lower(), "Failed to move todo to area by ID"
 
         # Verify final states
-        todo1 = things.get(todo1_id)
-        todo2 = things.get(todo2_id)
+        items = get_items_by_ids(todo1_id, todo2_id)
+        todo1 = items[todo1_id]
+        todo2 = items[todo2_id]
 
         assert todo1["project"] == project_id, "Todo1 should be in project"
         assert todo2["area"] == area_id, "Todo2 should be in area"
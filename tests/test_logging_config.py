@@ -0,0 +1,127 @@
+"""Test suite for the log handlers and formatters in logging_config."""
+
+import json
+import logging
+import os
+import struct
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+
+from things3_mcp import logging_config
+from things3_mcp.logging_config import BackgroundRotatingFileHandler, BinaryRotatingFileHandler, BinaryStructuredFormatter, DirectWriteRotatingFileHandler, StructuredFormatter
+
+pytestmark = pytest.mark.unit
+
+
+def _make_record(message: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("things3_mcp.test", level, __file__, 1, message, None, None, func="test")
+
+
+def test_background_rotation_keeps_every_record(tmp_path):
+    """Test that records written while a rotation is handed off land in exactly one file."""
+    log_file = tmp_path / "things3_mcp.log"
+    handler = BackgroundRotatingFileHandler(log_file, maxBytes=200, backupCount=100, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    messages = [f"record {i:04d}" for i in range(500)]
+    for message in messages:
+        handler.emit(_make_record(message))
+    handler.close()
+
+    log_files = sorted(tmp_path.glob("things3_mcp.log*"))
+    written = [line for path in log_files for line in path.read_text(encoding="utf-8").splitlines()]
+
+    assert len(log_files) > 1
+    assert sorted(written) == messages
+
+
+def test_direct_write_finishes_partial_writes(tmp_path):
+    """Test that a record is written in full when os.write accepts only part of it."""
+    log_file = tmp_path / "things3_mcp_errors.log"
+    handler = DirectWriteRotatingFileHandler(log_file)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    real_write = os.write
+
+    def write_one_byte(fd, data):
+        return real_write(fd, bytes(data[:1]))
+
+    with patch.object(logging_config.os, "write", side_effect=write_one_byte) as mock_write:
+        handler.emit(_make_record("partial write", logging.ERROR))
+    handler.close()
+
+    assert log_file.read_text(encoding="utf-8") == "partial write\n"
+    assert mock_write.call_count == len("partial write\n")
+
+
+def test_direct_write_reports_write_errors(tmp_path):
+    """Test that a failing os.write is routed to handleError instead of raising."""
+    handler = DirectWriteRotatingFileHandler(tmp_path / "things3_mcp_errors.log")
+    record = _make_record("disk full", logging.ERROR)
+
+    with patch.object(logging_config.os, "write", side_effect=OSError(28, "No space left on device")), patch.object(handler, "handleError") as mock_handle_error:
+        handler.emit(record)
+    handler.close()
+
+    mock_handle_error.assert_called_once_with(record)
+
+
+def test_binary_frames_round_trip(tmp_path):
+    """Test that each binary record is a 4-byte length prefix followed by a decodable msgpack payload."""
+    msgpack = pytest.importorskip("msgpack")
+    log_file = tmp_path / "things3_mcp_structured.msgpack"
+    handler = BinaryRotatingFileHandler(log_file, BinaryStructuredFormatter())
+
+    handler.emit(_make_record("first"))
+    handler.emit(_make_record("second", logging.WARNING))
+    handler.close()
+
+    data = log_file.read_bytes()
+    entries = []
+    offset = 0
+    while offset < len(data):
+        (length,) = struct.unpack(">I", data[offset : offset + 4])
+        entries.append(msgpack.unpackb(data[offset + 4 : offset + 4 + length], raw=False))
+        offset += 4 + length
+
+    assert offset == len(data)
+    assert [(entry["message"], entry["level"], entry["function"]) for entry in entries] == [("first", "INFO", "test"), ("second", "WARNING", "test")]
+
+
+def test_structured_format_without_function_name():
+    """Test that a record with no funcName is rendered as valid JSON with a null function."""
+    record = _make_record("no caller")
+    record.funcName = None
+
+    log_data = json.loads(StructuredFormatter().format(record))
+
+    assert log_data["function"] is None
+    assert log_data["message"] == "no caller"
+
+
+@pytest.mark.parametrize("level_name", ["WARN", "warn", "FATAL", "NOTSET"])
+def test_setup_logging_accepts_level_aliases(tmp_path, level_name):
+    """Test that the level aliases from the logging module are still accepted."""
+    root_logger = logging.getLogger()
+    saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+    try:
+        with patch.object(logging_config, "LOGS_DIR", tmp_path):
+            logging_config.setup_logging(console_level=level_name, file_level=level_name)
+        console_handler = logging_config._queue_listener.handlers[0]
+        assert console_handler.level == getattr(logging, level_name.upper())
+    finally:
+        logging_config._stop_queue_listener()
+        root_logger.handlers[:] = saved_handlers
+        root_logger.setLevel(saved_level)
+
+
+@pytest.mark.parametrize("created", [1760568217.123456, 1760568217.0, 1760568217.9999996, 0.5])
+def test_structured_timestamp_matches_isoformat(created):
+    """Test that structured log timestamps keep the datetime.isoformat() UTC format."""
+    record = _make_record("timestamp")
+    record.created = created
+
+    log_data = json.loads(StructuredFormatter().format(record))
+
+    assert log_data["timestamp"] == datetime.fromtimestamp(created, UTC).isoformat()
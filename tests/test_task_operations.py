@@ -19,7 +19,8 @@ import things  # noqa: E402
 from things3_mcp.applescript_bridge import (  # noqa: E402
     add_project,
     add_todo,
-    ensure_things_ready,
+    add_todos,
+    run_applescript,
     update_project,
     update_todo,
 )
@@ -35,16 +36,9 @@ from .conftest import (  # noqa: E402
     delete_test_tags,
     delete_todo_by_id,
     generate_random_string,
-    rename_test_area,
 )
 
 
-@pytest.fixture(scope="session", autouse=True)
-def _check_things_ready():
-    """Ensure Things is ready before running any tests."""
-    assert ensure_things_ready(), "Things app is not ready for testing"
-
-
 @pytest.fixture()
 def test_todo(test_namespace) -> Generator[str, None, None]:
     """Create a test todo and clean it up after the test."""
@@ -132,6 +126,42 @@ def test_concurrent_operations(test_namespace):
     assert success_count >= 4, f"Concurrent operations success rate too low: {success_count}/5"
 
 
+def test_add_todos_batch(cleanup_tracker, test_namespace):
+    """Test creating several todos in a single AppleScript run."""
+    titles = [f"{test_namespace} Batch Todo {i} {generate_random_string(3)}" for i in range(3)]
+    todo_ids = add_todos([{"title": titles[0]}, {"title": titles[1], "when": "someday"}, {"title": titles[2], "tags": []}])
+    for todo_id in todo_ids:
+        if todo_id:
+            cleanup_tracker.add_todo(todo_id)
+
+    assert len(todo_ids) == 3, "Should return one result per todo"
+    assert all(todo_ids), f"Every todo in the batch should be created: {todo_ids}"
+    assert [things.get(todo_id)["title"] for todo_id in todo_ids] == titles, "IDs should be returned in input order"
+
+
+def test_every_to_do_includes_nested_todos(cleanup_tracker, test_namespace):
+    """Test that Things' top-level `every to do` also returns todos inside projects and areas.
+
+    The namespace cleanup in conftest only scans `every to do`, so it relies on this.
+    """
+    project_id = add_project(title=f"{test_namespace} Container Project {generate_random_string(5)}")
+    cleanup_tracker.add_project(project_id)
+    area_id = create_test_area(f"Container-Area-{generate_random_string(5)}")
+    cleanup_tracker.add_area(area_id)
+    assert project_id and area_id, "Failed to create containers"
+
+    script = """
+    on run argv
+        tell application "Things3" to return (id of every to do) contains (item 1 of argv)
+    end run
+    """
+    for container_id in (project_id, area_id):
+        todo_id = add_todo(title=f"{test_namespace} Nested Todo {generate_random_string(5)}", list_id=container_id)
+        cleanup_tracker.add_todo(todo_id)
+        assert todo_id, "Failed to create nested todo"
+        assert run_applescript(script, args=(todo_id,)) == "true", f"every to do should include todo in {container_id}"
+
+
 def test_invalid_todo_id_update():
     """Test updating non-existent todo."""
     fake_id = "NonExistentTodoID12345"
@@ -166,19 +196,14 @@ def test_very_long_content(cleanup_tracker, test_namespace):
 def test_move_todo_between_areas(test_todo, test_namespace):
     """Test moving a todo between areas with simple and complex names."""
     # Create test areas
-    area1_id = create_test_area("area1")
-    area2_id = create_test_area("area2")
-    area3_id = create_test_area("area3")
+    area1_id = create_test_area("Family")
+    area2_id = create_test_area("AI & Automation")
+    area3_id = create_test_area("🏃🏽‍♂️ Fitness")
 
     assert area1_id, "Failed to create test area 1"
     assert area2_id, "Failed to create test area 2"
     assert area3_id, "Failed to create test area 3"
 
-    # Rename areas for testing
-    rename_test_area(area1_id, f"{test_namespace}-Family")
-    rename_test_area(area2_id, f"{test_namespace}-AI & Automation")
-    rename_test_area(area3_id, f"{test_namespace}-🏃🏽‍♂️ Fitness")
-
     # Move to first area
     result = update_todo(id=test_todo, list_name=f"{test_namespace}-Family")
     assert result, "Failed to move todo to Family area"
@@ -215,16 +240,12 @@ def test_area_move_with_other_updates(test_todo, test_namespace):
 def test_move_todo_between_areas_and_projects(test_todo, test_namespace):
     """Test moving a todo between areas and projects."""
     # Create test areas
-    area1_id = create_test_area("area1")
-    area2_id = create_test_area("area2")
+    area1_id = create_test_area("Family")
+    area2_id = create_test_area("AI & Automation")
 
     assert area1_id, "Failed to create test area 1"
     assert area2_id, "Failed to create test area 2"
 
-    # Rename areas for testing
-    rename_test_area(area1_id, f"{test_namespace}-Family")
-    rename_test_area(area2_id, f"{test_namespace}-AI & Automation")
-
     # First move to an area
     result = update_todo(id=test_todo, list_name=f"{test_namespace}-Family")
     assert result, "Failed to move todo to Family area"
@@ -248,14 +269,11 @@ def test_move_todo_between_areas_and_projects(test_todo, test_namespace):
 def test_create_project_in_area(test_namespace):
     """Test creating a project directly in an area using area_title parameter."""
     # Create test area with unique name
-    unique_area_name = f"area-{generate_random_string(8)}"
-    area_id = create_test_area(unique_area_name)
+    area_suffix = f"Family-{generate_random_string(5)}"
+    unique_family_name = f"{test_namespace}-{area_suffix}"
+    area_id = create_test_area(area_suffix)
     assert area_id, "Failed to create test area"
 
-    # Rename area for testing with unique name
-    unique_family_name = f"{test_namespace}-Family-{generate_random_string(5)}"
-    rename_test_area(area_id, unique_family_name)
-
     # Create project directly in the area
     project_title = f"{test_namespace}-Test Project in Area {generate_random_string(5)}"
     project_id = add_project(title=project_title, area_title=unique_family_name)
@@ -272,14 +290,11 @@ def test_create_project_in_area(test_namespace):
 def test_move_project_to_area(test_namespace):
     """Test moving an existing project to an area using update_project."""
     # Create test area with unique name
-    unique_area_name = f"area-{generate_random_string(8)}"
-    area_id = create_test_area(unique_area_name)
+    area_suffix = f"Work-{generate_random_string(5)}"
+    unique_work_name = f"{test_namespace}-{area_suffix}"
+    area_id = create_test_area(area_suffix)
     assert area_id, "Failed to create test area"
 
-    # Rename area for testing with unique name
-    unique_work_name = f"{test_namespace}-Work-{generate_random_string(5)}"
-    rename_test_area(area_id, unique_work_name)
-
     # Create project without area first
     project_title = f"{test_namespace}-Test Project to Move {generate_random_string(5)}"
     project_id = add_project(title=project_title)
@@ -344,14 +359,11 @@ def test_create_tag_independently(test_namespace):
 def test_add_todo_to_area_via_list_title(test_namespace):
     """Test adding a todo directly to an area using list_title parameter."""
     # Create test area with unique name
-    unique_area_name = f"area-{generate_random_string(8)}"
-    area_id = create_test_area(unique_area_name)
+    area_suffix = f"DIY-{generate_random_string(5)}"
+    unique_area_title = f"{test_namespace}-{area_suffix}"
+    area_id = create_test_area(area_suffix)
     assert area_id, "Failed to create test area"
 
-    # Rename area for testing with unique name
-    unique_area_title = f"{test_namespace}-DIY-{generate_random_string(5)}"
-    rename_test_area(area_id, unique_area_title)
-
     # Create todo directly in the area using list_title
     todo_title = f"{test_namespace}-Test Todo in Area {generate_random_string(5)}"
     todo_id = add_todo(title=todo_title, list_title=unique_area_title)